@@ -170,6 +170,9 @@ def get_db_connection() -> Generator[psycopg.Connection, None, None]:
         yield conn
 
 
+# Rows fetched per round-trip when streaming a full-catalog query through a server-side cursor.
+_STREAM_BATCH = 2000
+
 # Shared card columns: card-level fields plus multi-valued clan/type/deck/keyword text arrays.
 _CARD_COLUMNS = """
     SELECT
@@ -260,11 +263,18 @@ def _card_select(active_format: str | None = None) -> tuple[str, list]:
 
 
 def query_all_cards() -> list[dict]:
-    """Fetch every card with its multi-valued attributes and front image, ordered by name."""
+    """Fetch every card with its multi-valued attributes and front image, ordered by name.
+
+    The whole catalog is streamed through a server-side cursor in batches of
+    ``_STREAM_BATCH`` rows, so the client never holds the complete result set alongside the
+    returned list.
+    """
     select_sql, _ = _card_select()
-    with get_db_connection() as conn, conn.cursor() as cur:
+    # A server-side cursor lives inside a transaction; pooled connections are autocommit.
+    with get_db_connection() as conn, conn.transaction(), conn.cursor(name="all_cards") as cur:
+        cur.itersize = _STREAM_BATCH
         cur.execute(f"{select_sql} WHERE NOT c.is_back ORDER BY {_NAME_TIEBREAK}")
-        return cur.fetchall()
+        return list(cur)
 
 
 def search_cards(query: str = "", deck_filter: str | None = None) -> list[dict]:
@@ -373,6 +383,31 @@ def get_card_by_id(card_id: str) -> dict | None:
             return cur.fetchone()
 
 
+# Every column of a print the deck builder and card pages show; callers append the WHERE clause.
+_PRINTS_SELECT = """
+    SELECT
+        p.print_id, p.card_id, s.set_name, s.set_slug, p.rarity, p.artist,
+        front.path AS image_path,
+        COALESCE(back.path, pback.path) AS back_image_path,
+        p.flavor_text, p.rules_text,
+        COALESCE(bp.flavor_text, p.back_flavor) AS back_flavor_text,
+        p.back_title
+    FROM prints p
+    JOIN l5r_sets s ON s.set_id = p.set_id
+    JOIN cards c ON c.card_id = p.card_id
+    LEFT JOIN print_images front
+        ON front.print_id = p.print_id AND front.role = 'front' AND front.size = 'master'
+    -- A flip card's back image/flavor live on the back card's matching printing; a
+    -- printing's own special back (scroll / clan mon) is a role='back' image on it.
+    LEFT JOIN prints bp ON bp.card_id = c.back_card_id AND bp.printing_id = p.printing_id
+    LEFT JOIN print_images back
+        ON back.print_id = bp.print_id AND back.role = 'front' AND back.size = 'master'
+    LEFT JOIN print_images pback
+        ON pback.print_id = p.print_id AND pback.role = 'back' AND pback.size = 'master'
+"""
+_PRINTS_ORDER = "ORDER BY s.release_date NULLS LAST, p.print_id"
+
+
 def get_prints_by_card_id(card_id: str) -> list[dict]:
     """
     Fetch all prints for a specific card.
@@ -389,35 +424,37 @@ def get_prints_by_card_id(card_id: str) -> list[dict]:
     """
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    p.print_id, p.card_id, s.set_name, s.set_slug, p.rarity, p.artist,
-                    front.path AS image_path,
-                    COALESCE(back.path, pback.path) AS back_image_path,
-                    p.flavor_text, p.rules_text,
-                    COALESCE(bp.flavor_text, p.back_flavor) AS back_flavor_text,
-                    p.back_title
-                FROM prints p
-                JOIN l5r_sets s ON s.set_id = p.set_id
-                JOIN cards c ON c.card_id = p.card_id
-                LEFT JOIN print_images front
-                    ON front.print_id = p.print_id AND front.role = 'front' AND front.size = 'master'
-                -- A flip card's back image/flavor live on the back card's matching printing; a
-                -- printing's own special back (scroll / clan mon) is a role='back' image on it.
-                LEFT JOIN prints bp ON bp.card_id = c.back_card_id AND bp.printing_id = p.printing_id
-                LEFT JOIN print_images back
-                    ON back.print_id = bp.print_id AND back.role = 'front' AND back.size = 'master'
-                LEFT JOIN print_images pback
-                    ON pback.print_id = p.print_id AND pback.role = 'back' AND pback.size = 'master'
-                WHERE p.card_id = %s
-                ORDER BY s.release_date NULLS LAST, p.print_id
-            """,
-                (card_id,),
-            )
+            cur.execute(f"{_PRINTS_SELECT} WHERE p.card_id = %s {_PRINTS_ORDER}", (card_id,))
             return cur.fetchall()
 
 
+def get_prints_by_card_ids(card_ids: list[str]) -> dict[str, list[dict]]:
+    """
+    Fetch the prints of several cards in one query.
+
+    Parameters
+    ----------
+    card_ids : list of str
+        Card IDs. An empty list yields an empty map without touching the database.
+
+    Returns
+    -------
+    prints : dict mapping str to list of dict
+        Each requested card id to its prints, in the order ``get_prints_by_card_id`` returns them.
+        A card with no prints maps to an empty list.
+    """
+    prints_by_card: dict[str, list[dict]] = {card_id: [] for card_id in card_ids}
+    if not prints_by_card:
+        return prints_by_card
+    with get_db_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            f"{_PRINTS_SELECT} WHERE p.card_id = ANY(%s) {_PRINTS_ORDER}", (list(prints_by_card),)
+        )
+        for row in cur.fetchall():
+            prints_by_card[row["card_id"]].append(row)
+    return prints_by_card
+
+
 def get_card_revisions(card_id: str) -> list[dict]:
     """
     Fetch a card's rules-text revision history, oldest first.
@@ -23,6 +23,7 @@ from yasuki_core.engine.table import (
     owns_card,
     owns_deck,
     owns_zone,
+    seat_provinces,
     zone_accepts,
     zone_owned_by_card,
 )
@@ -593,7 +594,7 @@ def _reorder_hand(state: TableState, seat: PlayerId, intent: ReorderHand) -> lis
 
 
 def _reorder_pile(state: TableState, seat: PlayerId, intent: ReorderPile) -> list[Event]:
-    if getattr(intent.pile, "owner", None) != seat:
+    if intent.pile.owner != seat:
         return []
     if not ops.reorder_in_pile(state, intent.pile, intent.card_id, intent.index):
         return []
@@ -772,15 +773,17 @@ def _draw(state: TableState, seat: PlayerId, intent: Draw) -> list[Event]:
             return []
         dest = BATTLEFIELD
         position = None
-        for key, zone in state.zones.items():
-            if key.owner == seat and key.role is ZoneRole.PROVINCE and zone.has_capacity():
+        for key, zone in seat_provinces(state, seat):
+            if zone.has_capacity():
                 card.turn_face_down()
                 zone.add(card)
+                state.locations[card.id] = zone
                 dest = key
                 break
         if dest == BATTLEFIELD:
             card.turn_face_down()
             state.battlefield.add(card)
+            state.locations[card.id] = state.battlefield
             position = UNPLACED_BOARD_POS
             state.positions[card.id] = position
     state.seq += 1
@@ -11,6 +11,7 @@ from yasuki_core.engine.table import (
     TableState,
     ZoneKey,
     ZoneRole,
+    seat_provinces,
 )
 from yasuki_core.engine.zones import ProvinceZone
 from yasuki_core.game_pieces.cards import L5RCard
@@ -23,16 +24,28 @@ from yasuki_core.game_pieces.constants import Side
 # shape. Card-state flags (bow/flip/show/note/...) are already methods on L5RCard, not duplicated.
 
 
+def _remove_identical(cards: list[L5RCard], card: L5RCard) -> bool:
+    # Search from the top: the cards that move are mostly the most recently placed — a deck's top
+    # card, a battlefield card just dropped or brought to the top.
+    for i in range(len(cards) - 1, -1, -1):
+        if cards[i] is card:
+            del cards[i]
+            return True
+    return False
+
+
 def remove_from_location(state: TableState, card: L5RCard) -> None:
     """Remove ``card`` (by identity) from whatever zone, deck, or the battlefield holds it, dropping
     any battlefield position."""
+    # The recorded location is only a hint; fall back to a full scan when it misses.
+    hint = state.locations.pop(card.id, None)
+    if hint is not None and _remove_identical(hint.cards, card):
+        state.positions.pop(card.id, None)
+        return
     for container in (*state.zones.values(), *state.decks.values(), state.battlefield):
-        cards = container.cards
-        for i, held in enumerate(cards):
-            if held is card:
-                del cards[i]
-                state.positions.pop(card.id, None)
-                return
+        if _remove_identical(container.cards, card):
+            state.positions.pop(card.id, None)
+            return
 
 
 def _clear_attachment(state: TableState, card_id: str) -> None:
@@ -73,6 +86,7 @@ def move_card(
         remove_from_location(state, card)
         state.battlefield.add(card)
         state.positions[card.id] = pos
+        state.locations[card.id] = state.battlefield
         return True
 
     if isinstance(dest, DeckKey):
@@ -90,6 +104,7 @@ def move_card(
             deck.add_to_bottom([card])
         else:
             deck.add_to_top([card])
+        state.locations[card.id] = deck
         return True
 
     zone = state.zones[dest]
@@ -110,6 +125,7 @@ def move_card(
         zone.cards.insert(max(0, min(index, len(zone.cards))), card)
     else:
         zone.add(card)
+    state.locations[card.id] = zone
     return True
 
 
@@ -189,6 +205,7 @@ def fill_province(state: TableState, seat: PlayerId, zone: ProvinceZone) -> L5RC
     card.unbow()
     card.turn_face_down()
     zone.add(card)
+    state.locations[card.id] = zone
     return card
 
 
@@ -198,7 +215,9 @@ def draw_to_hand(state: TableState, seat: PlayerId) -> L5RCard | None:
     if card is None:
         return None
     card.turn_face_up()
-    state.zones[ZoneKey(seat, ZoneRole.HAND)].add(card)
+    hand = state.zones[ZoneKey(seat, ZoneRole.HAND)]
+    hand.add(card)
+    state.locations[card.id] = hand
     return card
 
 
@@ -209,12 +228,13 @@ def destroy_province(state: TableState, seat: PlayerId, zone_key: ZoneKey) -> li
     Returns the moved card ids."""
     zone = state.zones[zone_key]
     discard = state.zones[ZoneKey(seat, ZoneRole.DYNASTY_DISCARD)]
-    moved = []
-    while zone.cards:
-        card = zone.cards.pop()
+    cards = zone.cards[::-1]  # top card first, the order they come off the province
+    zone.cards.clear()
+    for card in cards:
         card.turn_face_up()
-        discard.add(card)
-        moved.append(card.id)
+        state.locations[card.id] = discard
+    discard.add_many(cards)
+    moved = [card.id for card in cards]
     del state.zones[zone_key]
     # A card attached to the province follows it off the board into its own side's discard; move_card
     # turns it face up and clears the attachment. Only fate/dynasty cards have a discard — a pregame
@@ -239,7 +259,9 @@ def discard_province(state: TableState, seat: PlayerId, zone: ProvinceZone) -> L
         return None
     card = zone.cards.pop()
     card.turn_face_up()
-    state.zones[ZoneKey(seat, ZoneRole.DYNASTY_DISCARD)].add(card)
+    discard = state.zones[ZoneKey(seat, ZoneRole.DYNASTY_DISCARD)]
+    discard.add(card)
+    state.locations[card.id] = discard
     return card
 
 
@@ -266,12 +288,11 @@ def straighten(state: TableState, seat: PlayerId) -> list[str]:
 def reveal_provinces(state: TableState, seat: PlayerId) -> list[str]:
     """Turn every face-down card in ``seat``'s provinces face-up; returns the revealed card ids."""
     revealed = []
-    for key, zone in state.zones.items():
-        if key.owner == seat and key.role is ZoneRole.PROVINCE:
-            for card in zone.cards:
-                if not card.face_up:
-                    card.turn_face_up()
-                    revealed.append(card.id)
+    for _, zone in seat_provinces(state, seat):
+        for card in zone.cards:
+            if not card.face_up:
+                card.turn_face_up()
+                revealed.append(card.id)
     return revealed
 
 
@@ -301,6 +322,7 @@ def spawn_token(
     state.cards_by_id[card.id] = card
     state.battlefield.add(card)
     state.positions[card.id] = position
+    state.locations[card.id] = state.battlefield
     return card
 
 
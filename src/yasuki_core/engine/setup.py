@@ -1,7 +1,14 @@
 from numpy.random import Generator
 
 from yasuki_core.engine.players import PlayerId
-from yasuki_core.engine.table import TableState, ZoneKey, ZoneRole, DeckKey, BoardPos
+from yasuki_core.engine.table import (
+    TableState,
+    ZoneKey,
+    ZoneRole,
+    DeckKey,
+    BoardPos,
+    seat_provinces,
+)
 from yasuki_core.engine.zones import ProvinceZone
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
@@ -106,13 +113,14 @@ def _starting_hand_size(resolved: ResolvedDeck) -> int:
 def _fill_provinces(state: TableState, seat: PlayerId) -> None:
     """Fill every empty province face-down from the seat's dynasty deck."""
     dynasty = state.decks[DeckKey(seat, Side.DYNASTY)]
-    for key, zone in state.zones.items():
-        if key.owner == seat and key.role is ZoneRole.PROVINCE and zone.has_capacity():
+    for _, zone in seat_provinces(state, seat):
+        if zone.has_capacity():
             card = dynasty.draw_one()
             if card is None:
                 break
             card.turn_face_down()
             zone.add(card)
+            state.locations[card.id] = zone
 
 
 def _draw_starting_hand(state: TableState, seat: PlayerId, count: int) -> None:
@@ -125,6 +133,7 @@ def _draw_starting_hand(state: TableState, seat: PlayerId, count: int) -> None:
             break
         card.turn_face_up()
         hand.add(card)
+        state.locations[card.id] = hand
 
 
 def flip_second_player_stronghold(
@@ -172,13 +181,15 @@ def _place_pregame(state: TableState, seat: PlayerId, cards: list[L5RCard]) -> N
         card.turn_face_up()
         state.cards_by_id[card.id] = card
         state.battlefield.add(card)
+        state.locations[card.id] = state.battlefield
         state.positions[card.id] = PREGAME_UNPLACED
 
 
 def _load_deck(state: TableState, key: DeckKey, cards: list[L5RCard], rng: Generator) -> None:
+    deck = state.decks[key]
     for card in cards:
         card.turn_face_down()
         state.cards_by_id[card.id] = card
-    deck = state.decks[key]
+        state.locations[card.id] = deck
     deck.cards = list(cards)
     deck.shuffle(rng)
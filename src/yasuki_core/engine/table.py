@@ -96,6 +96,9 @@ class TableState:
         Identity map over every card on the table, for fast intent lookup.
     creatable_tokens : dict mapping str to L5RCard
         Token templates the loaded decks can create, keyed by token card id, resolved at deck load.
+    locations : dict mapping str to (Zone or Deck)
+        The container each card id was last placed into, a hint that lets a removal skip scanning
+        every zone and deck. It may be stale or incomplete, so readers verify it before trusting it.
     seq : int
         Monotonic view version, bumped on every state change: by ``apply_intent`` for game intents
         and by :meth:`bump_version` for non-intent seat metadata, so no two distinct broadcasts share
@@ -114,6 +117,7 @@ class TableState:
     # A SpawnCard naming a token_id copies the matching template onto the battlefield, so spawning a
     # creatable token needs no live database call.
     creatable_tokens: dict[str, L5RCard] = field(default_factory=dict)
+    locations: dict[str, Zone | Deck] = field(default_factory=dict, compare=False, repr=False)
     seq: int = 0
 
     @classmethod
@@ -260,6 +264,14 @@ def owns_deck(state: TableState, seat: PlayerId, deck_key: DeckKey) -> bool:
     return deck_key.owner == seat
 
 
+def seat_provinces(state: TableState, seat: PlayerId) -> Iterator[tuple[ZoneKey, Zone]]:
+    """Yield ``seat``'s province zones with their keys, in table order."""
+    # Most zones are a seat's fixed piles, so the role test rejects first.
+    for key, zone in state.zones.items():
+        if key.role is ZoneRole.PROVINCE and key.owner == seat:
+            yield key, zone
+
+
 def zone_owned_by_card(zone: Zone, card: L5RCard) -> bool:
     """Return whether the card and zone owners are compatible: True unless both are set and differ.
     Guards against placing one seat's card into the other seat's owned zone."""
@@ -30,11 +30,15 @@ class Zone:
         return True
 
     def add_many(self, cards: Iterable[L5RCard]) -> int:
-        added = 0
-        for c in cards:
-            if self.add(c):
-                added += 1
-        return added
+        # Same outcome as adding one at a time — off-side cards skipped, the rest taken until
+        # full — in a single extend.
+        side = self.allowed_side
+        fitting = [c for c in cards if side is None or c.side is side]
+        room = self.max_capacity - len(self.cards)
+        if room < len(fitting):
+            fitting = fitting[: max(0, int(room))]
+        self.cards.extend(fitting)
+        return len(fitting)
 
     def remove(self, card: L5RCard) -> bool:
         try:
@@ -1,10 +1,12 @@
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Literal
 
 from yasuki_core.search.parse_search import INCLUDE_CATEGORIES, SearchTerm, parse_token
 
-_PAREN_TOKENS = "()"
+# Like `parse_search._QUERY_TOKEN`, but a bare parenthesis is a token of its own.
+_BOOLEAN_TOKEN = re.compile(r'[()]|(?:"[^"]*"?|[^ \t\n"()])+')
 
 
 def tokenize_boolean(query: str) -> list[str]:
@@ -26,30 +28,7 @@ def tokenize_boolean(query: str) -> list[str]:
     tokens : list of str
         Query tokens, with ``(`` and ``)`` as standalone entries.
     """
-    tokens: list[str] = []
-    current: list[str] = []
-    in_quotes = False
-
-    for char in query:
-        if char == '"':
-            in_quotes = not in_quotes
-            current.append(char)
-        elif not in_quotes and char in _PAREN_TOKENS:
-            if current:
-                tokens.append("".join(current))
-                current = []
-            tokens.append(char)
-        elif not in_quotes and char in " \t\n":
-            if current:
-                tokens.append("".join(current))
-                current = []
-        else:
-            current.append(char)
-
-    if current:
-        tokens.append("".join(current))
-
-    return tokens
+    return _BOOLEAN_TOKEN.findall(query)
 
 
 # AST for the boolean grammar. `Term` is a leaf (one field:op:value, carrying its own leaf
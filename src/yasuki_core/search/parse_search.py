@@ -113,6 +113,11 @@ NUMERIC_FIELDS = {
 # collides with a negative value like `exp:-1`; open-ended ranges use the >=/<= operators instead.
 _RANGE_SHORTHAND = re.compile(r"^(\d+)-(\d+)$")
 
+# A token is a run of non-whitespace in which a quoted stretch (spaces included) counts as one
+# piece; an unterminated quote runs to the end of the query. Compiled once: both run per keystroke.
+_QUERY_TOKEN = re.compile(r'(?:"[^"]*"?|[^ \t\n"])+')
+_FIELD_TERM = re.compile(r"^([a-zA-Z_]+)([:=><]+)(.+)$")
+
 
 def normalize_field_name(field: str) -> str:
     """
@@ -156,30 +161,7 @@ def tokenize_query(query: str) -> list[str]:
     >>> tokenize_query('"Doji Hoturi" force>3')
     ['"Doji Hoturi"', 'force>3']
     """
-    tokens = []
-    current_token = []
-    in_quotes = False
-    i = 0
-
-    while i < len(query):
-        char = query[i]
-
-        if char == '"':
-            in_quotes = not in_quotes
-            current_token.append(char)
-        elif char in (" ", "\t", "\n") and not in_quotes:
-            if current_token:
-                tokens.append("".join(current_token))
-                current_token = []
-        else:
-            current_token.append(char)
-
-        i += 1
-
-    if current_token:
-        tokens.append("".join(current_token))
-
-    return tokens
+    return _QUERY_TOKEN.findall(query)
 
 
 def parse_token(token: str) -> SearchTerm:
@@ -222,7 +204,7 @@ def parse_token(token: str) -> SearchTerm:
         return SearchTerm(field=None, operator=":", value=token[1:-1], negated=negated)
 
     # Try to match field:value or field>value patterns
-    match = re.match(r"^([a-zA-Z_]+)([:=><]+)(.+)$", token)
+    match = _FIELD_TERM.match(token)
 
     if match:
         field, operator, value = match.groups()
@@ -17,8 +17,7 @@ from yasuki_gui.field_view import FieldView
 from yasuki_core.engine.runner import GameRunner
 from yasuki_core.game_setup import build_state_from_deck
 from yasuki_gui.session import DEMO_DECK_PATH, build_demo_state
-from yasuki_gui.ui.dialogs import Dialogs
-from yasuki_gui.ui.images import ImageProvider
+from yasuki_gui.ui.dialogs import dialogs_for
 from yasuki_gui.ui.info_box import PlayerInfoBox
 from yasuki_gui.ui.menus import build_menubar
 from yasuki_gui.ui.phase_bar import PhaseBar
@@ -155,7 +154,7 @@ def main() -> None:
             runner.submit([card_id])
             after_human_action()
 
-        Dialogs(root, ImageProvider(root)).card_search(pool, choosable, "Dynasty deck", on_pick)
+        dialogs_for(root).card_search(pool, choosable, "Dynasty deck", on_pick)
 
     def after_human_action() -> None:
         nonlocal boost_producer
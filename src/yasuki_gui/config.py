@@ -17,6 +17,7 @@ class Hotkeys:
     flip: str = "f"
     invert: str = "d"
     fill: str = "l"
+    fill_all: str = "a"
     destroy: str = "c"
 
     # Deck actions
@@ -60,6 +61,7 @@ def load_hotkeys(config_path: str | Path | None = None) -> Hotkeys:
         flip=_get("flip", DEFAULT_HOTKEYS.flip),
         invert=_get("invert", DEFAULT_HOTKEYS.invert),
         fill=_get("fill", DEFAULT_HOTKEYS.fill),
+        fill_all=_get("fill_all", DEFAULT_HOTKEYS.fill_all),
         destroy=_get("destroy", DEFAULT_HOTKEYS.destroy),
         draw=_get("draw", DEFAULT_HOTKEYS.draw),
         shuffle=_get("shuffle", DEFAULT_HOTKEYS.shuffle),
@@ -30,6 +30,8 @@ HAND_GAP = 8
 
 # Image component tags
 CARD_TAG = "card"
+ZONE_TAG = "zone"
+DECK_TAG = "deck"
 ART_TAG = "art"
 BORDER_TAG = "border"
 SELECT_TAG = "select"
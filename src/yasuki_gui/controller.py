@@ -15,16 +15,20 @@ from yasuki_gui import theme
 from yasuki_gui.config import DEFAULT_HOTKEYS, Hotkeys
 from yasuki_gui.constants import CARD_H, CARD_W
 from yasuki_gui.layout import card_view_placement
-from yasuki_gui.services.actions import REGISTRY as ACTIONS, ActionContext
+from yasuki_gui.services.actions import (
+    REGISTRY as ACTIONS,
+    ActionContext,
+    resolve_clicked_card,
+)
 from yasuki_gui.services.drag import Drag, DragKind
 from yasuki_gui.services.hittest import (
+    bboxes_intersect as hittest_bboxes_intersect,
     bounds_contains as hittest_bounds_contains,
     resolve_drop_target as hittest_resolve_drop_target,
 )
 from yasuki_gui.services.permissions import can_interact
 from yasuki_gui.tags import card_tag
 from yasuki_gui.ui.images import load_back_image as _lbi, load_image as _li
-from yasuki_gui.visuals import MarqueeBoxVisual
 
 
 # How much larger than its on-board size the V-key card preview renders.
@@ -36,6 +40,8 @@ class FieldController:
         self.view = view
         self.drag: Drag = Drag()
         self._hotkeys: Hotkeys = DEFAULT_HOTKEYS
+        # The keys this controller has bound, so reconfiguring unbinds exactly those.
+        self._bound_hotkeys: set[str] = set()
         self._hover_card_tag: str | None = None
         self._hover_zone_tag: str | None = None
         self._card_view_item: int | None = None
@@ -57,28 +63,16 @@ class FieldController:
         v.bind_all("<Control-t>", self.on_toggle_player)
 
     def configure_hotkeys(self, hotkeys: Hotkeys) -> None:
-        old = {
-            self._hotkeys.bow,
-            self._hotkeys.flip,
-            self._hotkeys.invert,
-            self._hotkeys.fill,
-            self._hotkeys.destroy,
-            self._hotkeys.draw,
-            self._hotkeys.shuffle,
-            self._hotkeys.inspect,
-            self._hotkeys.view,
-        }
-        for key in {k for k in old if k}:
-            try:
-                self.view.unbind_all(f"<KeyPress-{key}>")
-            except tk.TclError:
-                pass
+        for key in self._bound_hotkeys:
+            self.view.unbind_all(f"<KeyPress-{key}>")
+        self._bound_hotkeys = set()
         self._hotkeys = hotkeys
         keys = {
             hotkeys.bow,
             hotkeys.flip,
             hotkeys.invert,
             hotkeys.fill,
+            hotkeys.fill_all,
             hotkeys.destroy,
             hotkeys.draw,
             hotkeys.shuffle,
@@ -87,6 +81,7 @@ class FieldController:
         }
         for k in {k for k in keys if k}:
             self.view.bind_all(f"<KeyPress-{k}>", self.on_key)
+            self._bound_hotkeys.add(k)
 
     # ----- helpers ----------------------------------------------------------
 
@@ -122,8 +117,10 @@ class FieldController:
         x0, y0 = self._marquee_start
         self.view.coords(self._marquee_rect, x0, y0, x, y)
         self.view.tag_raise(self._marquee_rect)
-        rect_visual = MarqueeBoxVisual((min(x0, x), min(y0, y), max(x0, x), max(y0, y)))
-        new_sel = {tag for tag, sp in self.view.sprites.items() if sp.intersects(rect_visual)}
+        rect = (min(x0, x), min(y0, y), max(x0, x), max(y0, y))
+        new_sel = {
+            tag for tag, sp in self.view.sprites.items() if hittest_bboxes_intersect(rect, sp.bbox)
+        }
         self.view._set_selection(new_sel)
 
     def _end_marquee(self) -> None:
@@ -232,7 +229,7 @@ class FieldController:
             return
 
         if tag.startswith("card:"):
-            sel = getattr(self.view, "_selected", set())
+            sel = self.view._selected
             if tag not in sel:
                 self.view._set_selection({tag})
                 sel = {tag}
@@ -398,9 +395,7 @@ class FieldController:
             return
         if tag.startswith("card:"):
             ctx = ActionContext(card_tag=tag, event=e, owner=self._owner_of(tag))
-            act = ACTIONS["card.toggle_bow"]
-            if act.when(self.view, ctx):
-                act.run(self.view, ctx)
+            self._run_if_enabled("card.toggle_bow", ctx)
 
     def on_escape(self, e: tk.Event) -> None:
         self.view._clear_selection()
@@ -420,20 +415,21 @@ class FieldController:
 
         self._hide_card_view()  # any other key dismisses a floating preview
 
-        if self._hover_zone_tag and key in {hk.flip, hk.fill, hk.destroy, hk.invert}:
+        if self._hover_zone_tag and key in {hk.flip, hk.fill, hk.fill_all, hk.destroy, hk.invert}:
             ctx = ActionContext(
                 zone_tag=self._hover_zone_tag, event=e, owner=self._owner_of(self._hover_zone_tag)
             )
             action_id = {
                 hk.flip: "zone.toggle_flip",
                 hk.fill: "zone.fill",
+                hk.fill_all: "zone.fill_all",
                 hk.destroy: "zone.destroy",
                 hk.invert: "zone.discard",
             }[key]
             self._run_if_enabled(action_id, ctx)
             return
 
-        sel = getattr(self.view, "_selected", set())
+        sel = self.view._selected
         target_tag = next(iter(sel)) if sel else self._hover_card_tag
         if not target_tag:
             return
@@ -448,12 +444,14 @@ class FieldController:
 
     def _run_if_enabled(self, action_id: str, ctx: ActionContext) -> None:
         act = ACTIONS[action_id]
+        ctx = resolve_clicked_card(self.view, ctx)
         if act.when(self.view, ctx):
-            act.run(self.view, ctx)
+            with self.view.batch_updates():
+                act.run(self.view, ctx)
 
     def _preview_showing(self) -> bool:
-        # A board redraw deletes every canvas item, so verify our item still exists rather than
-        # trusting the stored id, which a redraw would leave stale and desync the toggle.
+        # A board redraw deletes the preview, so verify our item still exists rather than trusting
+        # the stored id, which a redraw would leave stale and desync the toggle.
         return self._card_view_item is not None and bool(
             self.view.find_withtag(self._card_view_item)
         )
@@ -508,7 +506,9 @@ class FieldController:
             cx, cy, CARD_W, CARD_H, view_w, view_h, self.view.winfo_width(), canvas_h
         )
         self._card_view_photo = photo
-        self._card_view_item = self.view.create_image(left, top, image=photo, anchor="nw")
+        self._card_view_item = self.view.create_image(
+            left, top, image=photo, anchor="nw", tags=("card-view",)
+        )
 
     def on_toggle_player(self, e: tk.Event) -> None:
         """Switch the viewing/acting seat (debug only), flipping the board to that seat's view."""
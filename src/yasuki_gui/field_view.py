@@ -1,5 +1,6 @@
 import tkinter as tk
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from types import MappingProxyType
 
 from yasuki_core.engine.players import PlayerId
@@ -21,7 +22,7 @@ from yasuki_gui.layout import (
 )
 from yasuki_gui.services.hittest import resolve_tag_at as hittest_resolve_tag_at
 from yasuki_gui.tags import card_id_for_tag, card_tag, zone_tag
-from yasuki_gui.ui.images import ImageProvider
+from yasuki_gui.ui.images import ImageProvider, warm_essential_backs
 from yasuki_gui.visuals import CardSpriteVisual, HandVisual, ZoneVisual
 from yasuki_gui.visuals.cardface import RenderCard, to_render_card
 
@@ -72,6 +73,14 @@ class FieldView(tk.Canvas):
         self._selected: set[str] = set()
         self._marquee_start: tuple[int, int] | None = None
         self._marquee_rect: int | None = None
+        # Redraws queued for the next idle moment, so a burst of requests (a window resize fires
+        # many <Configure> events) costs a single pass.
+        self._pending_redraw: set[str] = set()
+        self._pending_reconcile = False
+        self._flush_id: str | None = None
+        # Reconciles requested inside batch_updates() wait for the outermost batch to exit.
+        self._batch_depth = 0
+        self._batch_dirty = False
 
         # Decision selection: when the engine awaits a choice, _selectable holds the candidate ids
         # (None when not choosing) and _selection the chosen subset, both rendered on the board.
@@ -95,6 +104,7 @@ class FieldView(tk.Canvas):
 
         self._controller = FieldController(self)
         self._images = ImageProvider(self)
+        warm_essential_backs()
 
         self.bind("<Enter>", lambda e: self.focus_set())
         self.bind("<Configure>", self._on_configure)
@@ -303,11 +313,38 @@ class FieldView(tk.Canvas):
         return hv.bbox if hv else (0, 0, -1, -1)
 
     def redraw_zone(self, tag: str) -> None:
+        """Queue a redraw of one province or hand for the next idle moment."""
+        self._pending_redraw.add(tag)
+        self._schedule_flush()
+
+    def request_reconcile(self) -> None:
+        """Queue a full :meth:`reconcile_all` for the next idle moment; it supersedes any queued
+        zone redraws."""
+        self._pending_reconcile = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush_redraws)
+
+    def _flush_redraws(self) -> None:
+        self._flush_id = None
+        if self._pending_reconcile:
+            self.reconcile_all()
+            return
+        tags, self._pending_redraw = self._pending_redraw, set()
+        for tag in tags:
+            if tag in self._zones:
+                self._redraw_zone_visual(tag, self._zones[tag])
+            elif tag in self._hands:
+                self._hands[tag].draw(self)  # updates its own items in place
+
+    def _redraw_zone_visual(self, tag: str, zv: ZoneVisual) -> None:
+        """Replace a zone's items, unless what they show has not changed since they were drawn."""
+        if zv.drawn_fingerprint == zv.fingerprint():
+            return
         self.delete(tag)
-        if tag in self._zones:
-            self._zones[tag].draw(self)
-        elif tag in self._hands:
-            self._hands[tag].draw(self)
+        zv.draw(self)
 
     # ----- reconciliation ---------------------------------------------------
 
@@ -316,10 +353,30 @@ class FieldView(tk.Canvas):
         # any chance of a stale projection. Event-targeted redraw can specialise this later.
         self.reconcile_all()
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Hold board reconciles until the outermost batch exits, then run at most one, so several
+        intents applied in one gesture cost a single redraw. Batches nest."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.reconcile_all()
+
     def reconcile_all(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._pending_reconcile = False
+        self._pending_redraw.clear()
         if self.state is None and self._snapshot is None:
             return
-        self.delete("all")
+        # Hands keep their canvas items between reconciles and update them in place; every other
+        # layer is redrawn by its own visual, and the transient overlays are cleared.
+        self.delete("table", "gold", "marquee", "hand-ghost", "card-view")
         self._draw_table()
         self._reconcile_zones()
         self._reconcile_sprites()
@@ -391,13 +448,14 @@ class FieldView(tk.Canvas):
         w, h = self._canvas_size()
         y = divider_y(h)
         self.create_line(int(w * 0.08), y, int(w * 0.92), y, fill=theme.MIDLINE, tags=("table",))
+        self.tag_lower("table")
 
     def _reconcile_zones(self) -> None:
         """Draw the on-board zones only: every seat's provinces and the viewer's own hand. Decks,
         discards, and banishes live in the off-board info panels, and the opponent's hand is never
         shown — those are read through the accessors below, not drawn here."""
         w, h = self._canvas_size()
-        province_keys = self._province_keys_by_owner()
+        province_slots = self._province_slots(w, h)
         wanted_zones: set[str] = set()
         wanted_hands: set[str] = set()
         for key, cards in self._render_zones():
@@ -423,9 +481,7 @@ class FieldView(tk.Canvas):
             tag = zone_tag(key)
             self._tag_to_key[tag] = key
             wanted_zones.add(tag)
-            ordered = province_keys[key.owner]
-            positions = province_positions(w, h, len(ordered), seat_at_bottom=seat_at_bottom)
-            px, py = positions[ordered.index(key)]
+            px, py = province_slots[key]
             label = _zone_label(key)
             zv = self._zones.get(tag)
             if zv is None:
@@ -435,44 +491,56 @@ class FieldView(tk.Canvas):
                 self._zones[tag] = zv
             zv.cards, zv.is_province, zv.name = cards, True, label
             zv.x, zv.y, zv.w, zv.h = px, py, CARD_W, CARD_H
-            zv.draw(self)
+            self._redraw_zone_visual(tag, zv)
         for tag in set(self._zones) - wanted_zones:
             self._zones.pop(tag, None)
             self._tag_to_key.pop(tag, None)
+            self.delete(tag)
         for tag in set(self._hands) - wanted_hands:
             self._hands.pop(tag, None)
             self._tag_to_key.pop(tag, None)
+            self.delete(tag)
 
     # ----- off-board reads (decks/discards/banishes/hand counts for the info panels) ---------
 
     def deck_summary(self, key: DeckKey) -> tuple[int, RenderCard | None]:
         """The card count and top render-card of a deck, from the active render source."""
-        for deck_key, count, top in self._render_decks():
-            if deck_key == key:
-                return count, top
-        return 0, None
+        if self._snapshot is not None:
+            deck_view = self._snapshot.decks.get(key)
+            if deck_view is None:
+                return 0, None
+            top = to_render_card(deck_view.top) if deck_view.top is not None else None
+            return deck_view.count, top
+        deck = self.state.decks.get(key)
+        if deck is None or not deck.cards:
+            return 0, None
+        return len(deck.cards), to_render_card(deck.cards[-1])
+
+    def _zone_source_cards(self, key: ZoneKey) -> Sequence:
+        """The raw cards (or card views) of one zone in the active render source, unconverted."""
+        source = self._snapshot.zones if self._snapshot is not None else self.state.zones
+        zone = source.get(key)
+        return zone.cards if zone is not None else []
 
     def zone_render_cards(self, key: ZoneKey) -> list[RenderCard]:
         """The render-cards held in a zone (e.g. a discard or banish pile), bottom to top, from the
         active render source. Empty if the zone is absent."""
-        for zone_key, cards in self._render_zones():
-            if zone_key == key:
-                return cards
-        return []
+        return [to_render_card(card) for card in self._zone_source_cards(key)]
 
     def hand_count(self, seat: PlayerId) -> int:
         """How many cards ``seat`` holds, from the active render source."""
-        return len(self.zone_render_cards(ZoneKey(seat, ZoneRole.HAND)))
+        return len(self._zone_source_cards(ZoneKey(seat, ZoneRole.HAND)))
 
     def _reconcile_sprites(self) -> None:
         w, h = self._canvas_size()
         wanted: set[str] = set()
         rendered = list(self._render_battlefield())
         home = self._home_positions(rendered, w, h)
+        flipped = self._flipped
         for rc, pos in rendered:
             tag = card_tag(rc.id)
             wanted.add(tag)
-            x, y = home.get(rc.id) or to_canvas(pos, flipped=self._flipped, canvas_w=w, canvas_h=h)
+            x, y = home.get(rc.id) or to_canvas(pos, flipped=flipped, canvas_w=w, canvas_h=h)
             sp = self._sprites.get(tag)
             if sp is None:
                 sp = CardSpriteVisual(rc, x, y, tag, images=self._images)
@@ -484,6 +552,7 @@ class FieldView(tk.Canvas):
         for tag in set(self._sprites) - wanted:
             self._sprites.pop(tag, None)
             self._selected.discard(tag)
+            self.delete(tag)
 
     def _home_positions(self, rendered, w: int, h: int) -> dict[str, tuple[int, int]]:
         """Stacked home-row positions for the unplaced cards among ``rendered``, grouped per owner:
@@ -494,7 +563,7 @@ class FieldView(tk.Canvas):
         personalities: dict[PlayerId | None, list[tuple[str, object]]] = {}
         for rc, pos in rendered:
             if pos is None or pos.x < 0 or pos.y < 0:
-                key = getattr(rc, "printed_id", None) or rc.id
+                key = rc.printed_id or rc.id
                 bucket = personalities if isinstance(rc, DynastyPersonality) else holdings
                 bucket.setdefault(rc.owner, []).append((rc.id, key))
         positions: dict[str, tuple[int, int]] = {}
@@ -513,6 +582,14 @@ class FieldView(tk.Canvas):
                 )
         return positions
 
+    def _province_slots(self, w: int, h: int) -> dict[ZoneKey, tuple[int, int]]:
+        """Each province's centre, laid out once per owner row."""
+        slots: dict[ZoneKey, tuple[int, int]] = {}
+        for owner, keys in self._province_keys_by_owner().items():
+            positions = province_positions(w, h, len(keys), seat_at_bottom=owner is self.seat)
+            slots.update(zip(keys, positions))
+        return slots
+
     def _province_keys_by_owner(self) -> dict[PlayerId, list[ZoneKey]]:
         by_owner: dict[PlayerId, list[ZoneKey]] = {seat: [] for seat in self._render_seats()}
         for key in self._zone_keys():
@@ -526,8 +603,14 @@ class FieldView(tk.Canvas):
         w, h = self.winfo_width(), self.winfo_height()
         return (max(w, self._cw), max(h, self._ch))
 
+    def destroy(self) -> None:
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
+
     def _on_configure(self, event: tk.Event) -> None:
         if event.width > 1 and event.height > 1:
             self._cw, self._ch = event.width, event.height
             if self.state is not None:
-                self.reconcile_all()
+                self.request_reconcile()
@@ -22,6 +22,20 @@ _ROW_STEP = CARD_H + _ROW_GAP
 _COLUMN_STEP = CARD_W + _CARD_GAP
 
 
+def _column_offsets(count: int) -> tuple[float, ...]:
+    return tuple((i - (count - 1) / 2) * _COLUMN_STEP for i in range(count))
+
+
+# Centre-justified column offsets for every row length a game realistically reaches, built once so
+# a reconcile looks them up; longer rows fall back to computing theirs.
+_OFFSETS_BY_COUNT: dict[int, tuple[float, ...]] = {n: _column_offsets(n) for n in range(13)}
+
+
+def _centred_offsets(count: int) -> tuple[float, ...]:
+    offsets = _OFFSETS_BY_COUNT.get(count)
+    return offsets if offsets is not None else _column_offsets(count)
+
+
 def _row_y(canvas_h: int, seat_at_bottom: bool) -> int:
     """The outermost card row, against the seat's edge; the human's sits just above the hand."""
     return canvas_h - _PROVINCE_INSET_BOTTOM if seat_at_bottom else _PROVINCE_INSET_TOP
@@ -66,9 +80,9 @@ def province_positions(
         return []
     y = _row_y(canvas_h, seat_at_bottom)
     center_x = canvas_w // 2
-    offsets = [(i - (count - 1) / 2) * _COLUMN_STEP for i in range(count)]
+    offsets = _centred_offsets(count)
     if not seat_at_bottom:
-        offsets.reverse()
+        offsets = offsets[::-1]
     return [(int(center_x + off), y) for off in offsets]
 
 
@@ -110,10 +124,8 @@ def home_stack_positions(
     if personality_row:  # centre-justified across the canvas, like the provinces
         center_x = canvas_w // 2
         row_y = _personality_row_y(canvas_h, seat_at_bottom)
-        base = {
-            col: (int(center_x + (col - (len(columns) - 1) / 2) * _COLUMN_STEP), row_y)
-            for col in columns.values()
-        }
+        offsets = _centred_offsets(len(columns))
+        base = {col: (int(center_x + offsets[col]), row_y) for col in columns.values()}
     else:  # left-justified in the holdings row, behind the stronghold
         base = {
             col: home_slot(canvas_w, canvas_h, col, seat_at_bottom=seat_at_bottom)
@@ -1,11 +1,12 @@
 import tkinter as tk
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, replace
 from tkinter import simpledialog
-from typing import Literal, Protocol
+from typing import Protocol
 
 from yasuki_core.engine.players import PlayerId
-from yasuki_core.engine.table import BoardPos, DeckKey, ZoneKey, ZoneRole
+from yasuki_core.engine.table import BoardPos, DeckKey, ZoneKey, ZoneRole, seat_provinces
 from yasuki_core.engine.intents import (
     Bow,
     DestroyProvince,
@@ -23,11 +24,12 @@ from yasuki_core.engine.intents import (
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
 from yasuki_gui.config import DEFAULT_HOTKEYS as HK
-from yasuki_gui.ui.dialogs import Dialogs
-from yasuki_gui.ui.images import ImageProvider
+from yasuki_gui.ui.dialogs import dialogs_for
 
 # A duplicated or token card lands a little down-right of its source so it does not hide it.
 _SPAWN_OFFSET = 24
+# Stands in for the selection of a view that keeps none, without allocating a set per lookup.
+_NO_SELECTION: frozenset[str] = frozenset()
 
 
 class HasView(Protocol):
@@ -37,43 +39,62 @@ class HasView(Protocol):
 
     def dispatch(self, intent) -> list: ...
     def key_for_tag(self, tag: str): ...
+    def batch_updates(self) -> AbstractContextManager[None]: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionContext:
-    """Exactly one of the tag fields is set depending on what was clicked."""
+    """Exactly one of the tag fields is set depending on what was clicked. ``card`` holds the
+    clicked card once it has been looked up (``card_resolved``), so the actions evaluated for one
+    menu share a single lookup."""
 
     card_tag: str | None = None
     zone_tag: str | None = None
     deck_tag: str | None = None
     event: tk.Event | None = None
     owner: PlayerId | None = None
+    card: L5RCard | None = None
+    card_resolved: bool = False
 
 
-@dataclass(frozen=True)
+def _always(view: HasView, ctx: ActionContext) -> bool:
+    return True
+
+
+def _do_nothing(view: HasView, ctx: ActionContext) -> None:
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class Action:
     id: str
     label: str
     hotkey: str | None = None
-    when: Callable[[HasView, ActionContext], bool] = lambda v, c: True
-    run: Callable[[HasView, ActionContext], None] = lambda v, c: None
+    when: Callable[[HasView, ActionContext], bool] = _always
+    run: Callable[[HasView, ActionContext], None] = _do_nothing
     group: str = "default"
 
+    @property
+    def menu_label(self) -> str:
+        """The menu entry text: the label, followed by the hotkey in parentheses if there is one."""
+        return self.label if self.hotkey is None else f"{self.label} ({self.hotkey})"
+
 
-def _get_tk_state(enabled: bool) -> Literal["normal", "disabled"]:
-    return "normal" if enabled else "disabled"
+def _run_batched(action: Action, view: HasView, ctx: ActionContext) -> None:
+    with view.batch_updates():
+        action.run(view, ctx)
 
 
 def build_menu(menu: tk.Menu, view: HasView, ctx: ActionContext, actions: Iterable[Action]) -> None:
+    ctx = resolve_clicked_card(view, ctx)
     last_group: str | None = None
     for a in actions:
         if last_group is not None and a.group != last_group:
             menu.add_separator()
         last_group = a.group
         enabled = a.when(view, ctx)
-        cmd = (lambda act=a: act.run(view, ctx)) if enabled else None
-        label = a.label if a.hotkey is None else f"{a.label} ({a.hotkey})"
-        menu.add_command(label=label, state=_get_tk_state(enabled), command=cmd)
+        cmd = (lambda act=a: _run_batched(act, view, ctx)) if enabled else None
+        menu.add_command(label=a.menu_label, state="normal" if enabled else "disabled", command=cmd)
 
 
 REGISTRY: dict[str, Action] = {}
@@ -94,6 +115,17 @@ def _card(view: HasView, tag: str | None) -> L5RCard | None:
     return view.state.cards_by_id.get(view.card_id_for_tag(tag) or "")
 
 
+def resolve_clicked_card(view: HasView, ctx: ActionContext) -> ActionContext:
+    """``ctx`` with its clicked card looked up once, for evaluating several actions against it."""
+    if ctx.card_tag is None or ctx.card_resolved:
+        return ctx
+    return replace(ctx, card=_card(view, ctx.card_tag), card_resolved=True)
+
+
+def _clicked_card(view: HasView, ctx: ActionContext) -> L5RCard | None:
+    return ctx.card if ctx.card_resolved else _card(view, ctx.card_tag)
+
+
 def _may(view: HasView, owner: PlayerId | None) -> bool:
     """UI affordance: a card/zone/deck is actionable when public or owned by the acting seat. This
     only grays out menu items — ``apply_intent`` re-validates ownership on dispatch."""
@@ -103,85 +135,84 @@ def _may(view: HasView, owner: PlayerId | None) -> bool:
 def _selection_ids(view: HasView, ctx: ActionContext) -> tuple[str, ...]:
     """The battlefield card ids a card action targets: the live selection when the clicked card is
     part of it, else just the clicked card."""
-    selected = getattr(view, "_selected", set())
-    tags = selected if (selected and ctx.card_tag in selected) else {ctx.card_tag}
-    ids = [view.card_id_for_tag(t) for t in tags if t]
+    selected = getattr(view, "_selected", _NO_SELECTION)
+    tags = selected if ctx.card_tag in selected else (ctx.card_tag,)
     state = view.state
-    return tuple(
-        cid for cid in ids if cid and state is not None and _may(view, state.cards_by_id[cid].owner)
-    )
+    if state is None:
+        return ()
+    # Hoisted once for the whole selection rather than re-read for every card.
+    cards_by_id, card_id_for_tag = state.cards_by_id, view.card_id_for_tag
+    ids = [card_id_for_tag(t) for t in tags if t]
+    return tuple(cid for cid in ids if cid and _may(view, cards_by_id[cid].owner))
 
 
-def _card_owner(view: HasView, ctx: ActionContext) -> PlayerId | None:
-    card = _card(view, ctx.card_tag)
-    return ctx.owner if ctx.owner is not None else (card.owner if card else None)
+def _may_act_on(view: HasView, ctx: ActionContext, card: L5RCard | None) -> bool:
+    """:func:`_may` for a clicked card, gated by the click's explicit owner if it has one, else by
+    the card's own; False when there is no card."""
+    if card is None:
+        return False
+    return _may(view, ctx.owner if ctx.owner is not None else card.owner)
 
 
 # ----- card actions ---------------------------------------------------------
 
 
 def _card_when(view: HasView, ctx: ActionContext) -> bool:
-    return _card(view, ctx.card_tag) is not None and _may(view, _card_owner(view, ctx))
+    return _may_act_on(view, ctx, _clicked_card(view, ctx))
 
 
-@_register
-def card_bow() -> Action:
+def _on_selection(intent_for: Callable[[L5RCard | None, tuple[str, ...]], object]):
+    """The run callback dispatching ``intent_for(clicked card, ids)`` over the targeted selection,
+    if it targets anything."""
+
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
         ids = _selection_ids(view, ctx)
-        if not ids:
-            return
-        view.dispatch(Unbow(ids) if card and card.bowed else Bow(ids))
+        if ids:
+            view.dispatch(intent_for(_clicked_card(view, ctx), ids))
+
+    return run
+
 
+@_register
+def card_bow() -> Action:
+    # The clicked card decides the direction for the whole selection.
+    run = _on_selection(lambda card, ids: Unbow(ids) if card and card.bowed else Bow(ids))
     return Action("card.toggle_bow", "Bow / Unbow", HK.bow, _card_when, run, "card")
 
 
 @_register
 def card_flip() -> Action:
-    def run(view, ctx):
-        ids = _selection_ids(view, ctx)
-        if ids:
-            view.dispatch(Flip(ids))
-
+    run = _on_selection(lambda _, ids: Flip(ids))
     return Action("card.toggle_flip", "Flip Up/Down", HK.flip, _card_when, run, "card")
 
 
 @_register
 def card_invert() -> Action:
-    def run(view, ctx):
-        ids = _selection_ids(view, ctx)
-        if ids:
-            view.dispatch(Invert(ids))
-
+    run = _on_selection(lambda _, ids: Invert(ids))
     return Action("card.toggle_invert", "Invert", HK.invert, _card_when, run, "card")
 
 
-def _send_to(role: ZoneRole, side: Side | None, to_bottom: bool = False):
+def _send_to(role: ZoneRole | None, side: Side | None, to_bottom: bool = False):
+    """The run/when pair sending the clicked card to the acting seat's ``role`` zone, or to the
+    top (bottom with ``to_bottom``) of its own deck when ``role`` is None. ``side`` limits the
+    action to cards of that side."""
+
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         if card is None:
             return
-        view.dispatch(MoveCard(card.id, ZoneKey(view.seat, role), to_bottom=to_bottom))
+        dest = ZoneKey(view.seat, role) if role is not None else DeckKey(view.seat, card.side)
+        view.dispatch(MoveCard(card.id, dest, to_bottom=to_bottom))
 
     def when(view, ctx):
-        card = _card(view, ctx.card_tag)
-        if card is None or not _may(view, _card_owner(view, ctx)):
+        card = _clicked_card(view, ctx)
+        if not _may_act_on(view, ctx, card):
             return False
         return side is None or card.side is side
 
     return run, when
 
 
-def _send_to_deck(to_bottom: bool):
-    def run(view, ctx):
-        card = _card(view, ctx.card_tag)
-        if card is None:
-            return
-        view.dispatch(MoveCard(card.id, DeckKey(view.seat, card.side), to_bottom=to_bottom))
-
-    return run
-
-
 @_register
 def card_send_to_hand() -> Action:
     run, when = _send_to(ZoneRole.HAND, Side.FATE)
@@ -202,20 +233,14 @@ def card_send_to_dynasty_discard() -> Action:
 
 @_register
 def card_send_to_top() -> Action:
-    return Action(
-        "card.send_deck_top", "Top of Deck", when=_card_when, run=_send_to_deck(False), group="send"
-    )
+    run, when = _send_to(None, None)
+    return Action("card.send_deck_top", "Top of Deck", when=when, run=run, group="send")
 
 
 @_register
 def card_send_to_bottom() -> Action:
-    return Action(
-        "card.send_deck_bottom",
-        "Bottom of Deck",
-        when=_card_when,
-        run=_send_to_deck(True),
-        group="send",
-    )
+    run, when = _send_to(None, None, to_bottom=True)
+    return Action("card.send_deck_bottom", "Bottom of Deck", when=when, run=run, group="send")
 
 
 # ----- zone (province) actions ----------------------------------------------
@@ -258,6 +283,25 @@ def province_fill() -> Action:
     return Action("zone.fill", "Fill", HK.fill, when, run, "zone")
 
 
+def _open_provinces(view: HasView) -> list[ZoneKey]:
+    return [key for key, zone in seat_provinces(view.state, view.seat) if zone.has_capacity()]
+
+
+@_register
+def province_fill_all() -> Action:
+    # Actions run inside one view batch, so refilling every open province costs one redraw.
+    def when(view, ctx):
+        key = _province_key(view, ctx)
+        return key is not None and key.owner == view.seat and bool(_open_provinces(view))
+
+    def run(view, ctx):
+        for key in _open_provinces(view):
+            if not view.dispatch(FillProvince(key)):
+                break  # the dynasty deck ran dry
+
+    return Action("zone.fill_all", "Fill All Empty", HK.fill_all, when, run, "zone")
+
+
 @_register
 def province_destroy() -> Action:
     def when(view, ctx):
@@ -321,15 +365,11 @@ def apply_note(view: HasView, card_id: str, text: str | None) -> None:
 @_register
 def card_flip_face() -> Action:
     def when(view, ctx):
-        card = _card(view, ctx.card_tag)
-        return (
-            card is not None
-            and card.back_card_id is not None
-            and _may(view, _card_owner(view, ctx))
-        )
+        card = _clicked_card(view, ctx)
+        return card is not None and card.back_card_id is not None and _may_act_on(view, ctx, card)
 
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         if card is not None:
             view.dispatch(FlipFace((card.id,)))
 
@@ -339,11 +379,11 @@ def card_flip_face() -> Action:
 @_register
 def card_set_note() -> Action:
     def when(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         return card is not None and card.face_up
 
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         if card is None:
             return
         master = view.winfo_toplevel()
@@ -359,11 +399,11 @@ def card_set_note() -> Action:
 @_register
 def card_duplicate() -> Action:
     def when(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         return card is not None and card.face_up
 
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         if card is not None:
             duplicate_card(view, card.id)
 
@@ -373,11 +413,11 @@ def card_duplicate() -> Action:
 @_register
 def card_remove() -> Action:
     def when(view, ctx):
-        card = _card(view, ctx.card_tag)
-        return card is not None and card.is_token and _may(view, _card_owner(view, ctx))
+        card = _clicked_card(view, ctx)
+        return card is not None and card.is_token and _may_act_on(view, ctx, card)
 
     def run(view, ctx):
-        card = _card(view, ctx.card_tag)
+        card = _clicked_card(view, ctx)
         if card is not None:
             view.dispatch(RemoveCard(card.id))
 
@@ -390,8 +430,7 @@ def table_create_token() -> Action:
         if ctx.event is None:
             return
         pos = view.canonical_pos(ctx.event.x, ctx.event.y)
-        master = view.winfo_toplevel()
-        Dialogs(master, ImageProvider(master)).create_token(
+        dialogs_for(view.winfo_toplevel()).create_token(
             lambda name, side: spawn_token(view, name, side, pos)
         )
 
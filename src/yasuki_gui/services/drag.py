@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from collections.abc import Iterable
 
 from yasuki_core.game_pieces.cards import L5RCard
 
@@ -32,19 +31,3 @@ class Drag:
 
     def left_source(self, x: int, y: int) -> bool:
         return self.src_bbox is not None and not self.contains(self.src_bbox, x, y)
-
-    def resolve_drop_target_center_first(
-        self,
-        x: int,
-        y: int,
-        zone_items: Iterable[tuple[str, BBox]],
-        deck_items: Iterable[tuple[str, BBox]],
-    ) -> str | None:
-        """Pure resolver: given current center and the current bboxes, pick a target."""
-        for ztag, zb in zone_items:
-            if self.contains(zb, x, y):
-                return ztag
-        for dtag, db in deck_items:
-            if self.contains(db, x, y):
-                return dtag
-        return None
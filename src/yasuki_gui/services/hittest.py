@@ -1,7 +1,11 @@
 import tkinter as tk
+from itertools import chain
 
+from yasuki_gui.constants import CARD_TAG, ZONE_TAG
 from yasuki_gui.services.drag import BBox
 
+_HIT_KINDS = frozenset((CARD_TAG, ZONE_TAG))
+
 
 def bounds_contains(bbox: BBox, x: int, y: int) -> bool:
     """Return True if point (x,y) lies within bbox (x0,y0,x1,y1)."""
@@ -9,25 +13,33 @@ def bounds_contains(bbox: BBox, x: int, y: int) -> bool:
     return x0 <= x <= x1 and y0 <= y <= y1
 
 
+def bboxes_intersect(a: BBox, b: BBox) -> bool:
+    """Return True if bboxes ``a`` and ``b`` overlap or touch."""
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
+    return ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1
+
+
 def resolve_drop_target(view, x: int, y: int) -> str | None:
     """Resolve a drop target tag (a hand or province zone) given a view and point. Decks and the
     other piles live off-board, so they are not drop targets."""
-    for tag, hv in {**view.hands, **view.zones}.items():
+    for tag, hv in chain(view.hands.items(), view.zones.items()):
         if bounds_contains(hv.bbox, x, y):
             return tag
     return None
 
 
 def resolve_tag_at(view, event: tk.Event) -> str | None:
-    """Return tag at event using view.find_withtag/gettags.
+    """Return the primary tag of the card or zone item under the pointer.
 
-    The view is expected to be a tk.Canvas-like object with find_withtag and gettags.
+    The view is expected to be a tk.Canvas-like object with find_withtag and gettags. Board items
+    are created with their primary tag first and a kind tag after it, so a single membership test
+    on the kind identifies interactive items.
     """
     item = view.find_withtag("current")
     if not item:
         return None
     tags = view.gettags(item[0])
-    for t in tags:
-        if t.startswith("card:") or t.startswith("zone:"):
-            return t
+    if tags and not _HIT_KINDS.isdisjoint(tags):
+        return tags[0]
     return None
@@ -1,7 +1,11 @@
+from functools import cache, lru_cache
+
 from yasuki_core.engine.table import DeckKey, ZoneKey, ZoneRole
 
 # Canvas item tags are opaque strings derived deterministically from the domain keys, so hit-testing
 # and drag code keep working with plain prefixes while the view maps each tag back to its key.
+# The builders are memoized: every reconcile re-derives each visual's tag, and handing back the same
+# string object lets the view's tag-keyed dicts reuse its cached hash instead of formatting anew.
 
 _ROLE_TAG = {
     ZoneRole.HAND: "hand",
@@ -13,18 +17,24 @@ _ROLE_TAG = {
 }
 
 
+@lru_cache(maxsize=4096)
 def card_tag(card_id: str) -> str:
     return f"card:{card_id}"
 
 
+_CARD_PREFIX_LEN = len("card:")
+
+
 def card_id_for_tag(tag: str) -> str | None:
-    return tag[len("card:") :] if tag.startswith("card:") else None
+    return tag[_CARD_PREFIX_LEN:] if tag.startswith("card:") else None
 
 
+@cache
 def deck_tag(key: DeckKey) -> str:
     return f"deck:{key.owner.name}:{key.side.name}"
 
 
+@cache
 def zone_tag(key: ZoneKey) -> str:
     base = f"zone:{key.owner.name}:{_ROLE_TAG[key.role]}"
     return f"{base}:{key.idx}" if key.idx is not None else base
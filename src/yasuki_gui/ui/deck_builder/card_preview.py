@@ -1,5 +1,8 @@
 import logging
+import re
 import tkinter as tk
+from concurrent.futures import Future
+from functools import cache, lru_cache
 from pathlib import Path
 
 from PIL import Image, ImageTk
@@ -8,11 +11,16 @@ from yasuki_core import paths as asset_paths
 from yasuki_core.card_art import back_era_for_set
 from yasuki_core.paths import resolve_set_image_path
 from yasuki_gui.constants import CARD_W, CARD_H
+from yasuki_gui.ui.images import submit_decode
 
 logger = logging.getLogger(__name__)
 
 _card_backs: dict[tuple[str, str], str] | None = None
 
+# What follows a card id's last "_experienced": a level number with an optional "_<campaign>", or
+# a bare campaign (either may be empty).
+_EXPERIENCED_RE = re.compile(r".*_experienced_*(?:(\d+)(?:_(.*))?|(.*))$", re.DOTALL)
+
 
 def _card_back_path(deck: str, era: str) -> Path | None:
     """The generic back image for a deck/era ('old'/'new'), resolved from the card-backs table."""
@@ -31,6 +39,9 @@ def _card_back_path(deck: str, era: str) -> Path | None:
 
 PREVIEW_CARD_W = 4 * CARD_W
 PREVIEW_CARD_H = 4 * CARD_H
+_RESAMPLE = Image.Resampling.LANCZOS
+# How often the Tk thread checks on a preview decode running in the background.
+_DECODE_POLL_MS = 15
 
 DEFAULT_BY_TYPE: dict[str, Path] = {
     "strategy": asset_paths.DEFAULT_STRATEGY,
@@ -80,6 +91,9 @@ def back_image_source(print_info: dict):
     return resolved if resolved and resolved.exists() else None
 
 
+# The name parsers below are pure functions of one string drawn from the card catalog, and the filter
+# list reformats every matching card on each keystroke, so each is memoized for the session.
+@cache
 def _extract_base_name(full_name: str) -> str:
     """
     Extract base personality name without subtitle.
@@ -104,6 +118,7 @@ def _extract_base_name(full_name: str) -> str:
     return full_name
 
 
+@cache
 def _extract_experience_from_extended_title(extended_title: str) -> str:
     """
     Extract the experience marker from extended title.
@@ -165,7 +180,7 @@ def format_card_display_name(
     else:
         if not include_subtitle:
             name = _extract_base_name(name)
-        exp_level = _extract_experience_level(card)
+        exp_level = _extract_experience_level(card.get("card_id", ""))
 
         display_parts = [name]
         if exp_level:
@@ -178,7 +193,8 @@ def format_card_display_name(
     return display_name
 
 
-def _extract_experience_level(card: dict) -> str | None:
+@cache
+def _extract_experience_level(card_id: str) -> str | None:
     """
     Extract an experience-level code from a card's slug identifier.
 
@@ -187,25 +203,18 @@ def _extract_experience_level(card: dict) -> str | None:
     ``"expN_<campaign>"`` for campaign-specific experienced versions. Returns
     None for base (non-experienced) cards.
     """
-    card_id = card.get("card_id", "")
-
     if "_inexperienced" in card_id:
         return "inexp"
-
-    if "_experienced" in card_id:
-        suffix = card_id.rsplit("_experienced", 1)[1].lstrip("_")
-        if not suffix:
-            return "exp"
-        if suffix.isdigit():
-            return f"exp{suffix}"
-        level, _, campaign = suffix.partition("_")
-        if level.isdigit():
-            return f"exp{level}_{campaign}" if campaign else f"exp{level}"
-        return f"exp_{suffix}"
-
-    return None
+    m = _EXPERIENCED_RE.match(card_id)
+    if m is None:
+        return None
+    level, campaign, other = m.groups()
+    if level is None:
+        return f"exp_{other}" if other else "exp"
+    return f"exp{level}_{campaign}" if campaign else f"exp{level}"
 
 
+@cache
 def _format_experience_level(exp_level: str) -> str:
     """
     Format experience level for display.
@@ -247,6 +256,13 @@ def _format_experience_level(exp_level: str) -> str:
     return f"- {exp_level}"
 
 
+@lru_cache(maxsize=64)
+def _preview_pil(image_path: str) -> Image.Image:
+    """Decode and resize an image to the preview size once; browsing back and forth between prints
+    revisits the same few paths. The PhotoImage is built per call, since it is bound to a master."""
+    return Image.open(image_path).resize((PREVIEW_CARD_W, PREVIEW_CARD_H), _RESAMPLE)
+
+
 def load_large_image(image_path: Path, master: tk.Misc) -> ImageTk.PhotoImage | None:
     """
     Load a large preview image for the deck builder.
@@ -264,10 +280,7 @@ def load_large_image(image_path: Path, master: tk.Misc) -> ImageTk.PhotoImage |
         Resized image at PREVIEW size, or None if loading fails
     """
     try:
-        img = Image.open(str(image_path))
-        resample = getattr(Image, "LANCZOS", getattr(Image, "Resampling", Image).LANCZOS)
-        img = img.resize((PREVIEW_CARD_W, PREVIEW_CARD_H), resample)
-        return ImageTk.PhotoImage(img, master=master)
+        return ImageTk.PhotoImage(_preview_pil(str(image_path)), master=master)
     except Exception:
         return None
 
@@ -296,6 +309,11 @@ class CardPreviewController:
         self._current_card_id: str | None = None
         self._current_prints: list[dict] = []
         self._current_print_index: int = 0
+        # The file behind the image on screen, so switching to a print that shows the same file
+        # (a reprint with unchanged art) keeps the current photo instead of decoding it again.
+        self._shown_image_path: Path | None = None
+        # Bumped on every image change; a background decode only lands if no newer one started.
+        self._image_generation = 0
 
     def load_card(self, card_id: str, preferred_print_id: int | None = None) -> None:
         """
@@ -365,9 +383,34 @@ class CardPreviewController:
         self.print_selector.update(set_name, self._current_print_index, len(self._current_prints))
 
     def _render_image(self, card: dict, print_info: dict) -> None:
-        """Render card image in preview."""
-        photo = self._load_card_image(card, print_info)
+        """Render card image in preview, unless it is the file already shown.
+
+        A print's image file is decoded and resized on a worker thread, so stepping quickly through
+        prints never waits on Pillow; the previous photo stays up until the new one is ready."""
+        self._image_generation += 1
+        if print_info.get("is_custom"):
+            self._show_photo(self._load_custom_image(card, print_info), None)
+            return
+        path = self._image_path(card, print_info)
+        if path == self._shown_image_path and self.image_label.image is not None:
+            return
+        job = submit_decode(_preview_pil, str(path))
+        self._await_photo(job, self._image_generation, path)
 
+    def _await_photo(self, job: Future, generation: int, path: Path) -> None:
+        """Poll a background decode from the Tk thread and show it, unless a newer one started."""
+        if generation != self._image_generation or not self.image_label.winfo_exists():
+            return
+        if not job.done():
+            self.master.after(_DECODE_POLL_MS, self._await_photo, job, generation, path)
+            return
+        photo = None
+        if job.exception() is None:
+            photo = ImageTk.PhotoImage(job.result(), master=self.master)
+        self._show_photo(photo, path)
+
+    def _show_photo(self, photo: ImageTk.PhotoImage | None, path: Path | None) -> None:
+        self._shown_image_path = path if photo is not None else None
         if photo is not None:
             self.image_label.configure(image=photo)  # type: ignore[arg-type]
             self.image_label.image = photo  # type: ignore[attr-defined]
@@ -375,22 +418,22 @@ class CardPreviewController:
             self.image_label.configure(image="")
             self.image_label.image = None  # type: ignore[attr-defined]
 
-    def _load_card_image(self, card: dict, print_info: dict) -> ImageTk.PhotoImage | None:
-        """Load card image or fallback to default."""
-        if print_info.get("is_custom"):
-            from yasuki_gui.ui.deck_builder.custom_art import render_custom_image
+    def _load_custom_image(self, card: dict, print_info: dict) -> ImageTk.PhotoImage | None:
+        """Render a custom (art-swap) print's composite, or fall back to the card back."""
+        from yasuki_gui.ui.deck_builder.custom_art import render_custom_image
 
-            composite = render_custom_image(print_info["recipe"], self.repository)
-            if composite is not None:
-                resized = composite.resize((PREVIEW_CARD_W, PREVIEW_CARD_H), Image.LANCZOS)
-                return ImageTk.PhotoImage(resized, master=self.master)
-            return self._load_back_image(card, print_info)
+        composite = render_custom_image(print_info["recipe"], self.repository)
+        if composite is not None:
+            resized = composite.resize((PREVIEW_CARD_W, PREVIEW_CARD_H), _RESAMPLE)
+            return ImageTk.PhotoImage(resized, master=self.master)
+        return self._load_back_image(card, print_info)
 
+    def _image_path(self, card: dict, print_info: dict) -> Path:
+        """The file a (non-custom) print previews: its own image or type default, else the back."""
         img_path = self._resolve_image_path(card, print_info)
         if img_path and img_path.exists():
-            return load_large_image(img_path, self.master)
-
-        return self._load_back_image(card, print_info)
+            return img_path
+        return self._back_path(card, print_info)
 
     def _resolve_image_path(self, card: dict, print_info: dict) -> Path | None:
         """Resolve image path from print info or card type default."""
@@ -408,7 +451,11 @@ class CardPreviewController:
     def _load_back_image(
         self, card: dict, print_info: dict | None = None
     ) -> ImageTk.PhotoImage | None:
-        """Load the generic card back as a fallback, matching the card's deck and print era.
+        """Load the generic card back as a fallback, matching the card's deck and print era."""
+        return load_large_image(self._back_path(card, print_info), self.master)
+
+    def _back_path(self, card: dict, print_info: dict | None = None) -> Path:
+        """The generic card back for the card's deck and print era.
 
         Prints before Gold Edition show the old back; Gold onward the new back."""
         decks = card.get("decks") or []
@@ -418,7 +465,7 @@ class CardPreviewController:
         back_path = _card_back_path(deck, era)
         if back_path is None:
             back_path = asset_paths.FATE_BACK if deck == "Fate" else asset_paths.DYNASTY_BACK
-        return load_large_image(back_path, self.master)
+        return back_path
 
     def current_recipient(self) -> dict | None:
         """Resolve the real print to land borrowed art on, seeing through a custom print.
@@ -454,7 +501,6 @@ class CardPreviewController:
     def _render_stats(self, card: dict) -> None:
         """Render card statistics."""
         self.stats_panel.update_stats(card)
-        self.master.update_idletasks()
 
     def _render_flavor(self, print_info: dict) -> None:
         """Render card flavor text from print info."""
@@ -477,6 +523,8 @@ class CardPreviewController:
         """Clear all preview elements."""
         self.image_label.configure(image="")
         self.image_label.image = None
+        self._shown_image_path = None
+        self._image_generation += 1
         self.stats_panel.clear()
         self.flavor_widget.configure(state="normal")
         self.flavor_widget.delete("1.0", tk.END)
@@ -1,5 +1,27 @@
 import tkinter as tk
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+
+_FONT = ("TkDefaultFont", 9)
+_FONT_BOLD = ("TkDefaultFont", 9, "bold")
+# The numeric stats shown on the panel's second row, as (abbreviation, card field), in order.
+_STAT_ABBREVS = (
+    ("F", "force"),
+    ("C", "chi"),
+    ("PH", "personal_honor"),
+    ("HR", "honor_requirement"),
+    ("Foc", "focus"),
+    ("GC", "gold_cost"),
+    ("GP", "gold_production"),
+    ("PS", "province_strength"),
+    ("SH", "starting_honor"),
+)
+
+
+def set_text(widget: tk.Misc, text: str) -> None:
+    """Set a label's text only if it differs; reconfiguring a label, even to the same text, makes Tk
+    recompute its size and redraw it."""
+    if widget.cget("text") != text:
+        widget.configure(text=text)
 
 
 class ScrollableListBox:
@@ -34,6 +56,28 @@ class ScrollableListBox:
     def insert(self, index: int | str, item: str) -> None:
         self.listbox.insert(index, item)
 
+    def insert_many(self, items: Sequence[str]) -> None:
+        """Append ``items`` in a single Tk call rather than one per row."""
+        if items:
+            self.listbox.insert(tk.END, *items)
+
+    def set_items(self, items: Sequence[str]) -> None:
+        """Show exactly ``items``, rewriting only the rows between the leading and trailing runs
+        that already match, so narrowing a search by one letter touches a few rows, not all."""
+        old = self.listbox.get(0, tk.END)
+        n_old, n_new = len(old), len(items)
+        limit = min(n_old, n_new)
+        start = 0
+        while start < limit and old[start] == items[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[n_old - 1 - end] == items[n_new - 1 - end]:
+            end += 1
+        if start < n_old - end:
+            self.listbox.delete(start, n_old - end - 1)
+        if start < n_new - end:
+            self.listbox.insert(start, *items[start : n_new - end])
+
     def refresh(self, *args, **kwargs) -> None:
         """Refresh the listbox contents."""
         pass
@@ -49,39 +93,35 @@ class CardStatsPanel:
         self.row1_frame = tk.Frame(self.frame)
         self.row1_frame.pack(fill="x", pady=2)
 
-        self.name_label = tk.Label(self.row1_frame, text="—", anchor="w", font=("TkDefaultFont", 9))
+        self.name_label = tk.Label(self.row1_frame, text="—", anchor="w", font=_FONT)
         self.name_label.pack(side="left", padx=(0, 8))
 
-        self.type_label = tk.Label(self.row1_frame, text="—", anchor="w", font=("TkDefaultFont", 9))
+        self.type_label = tk.Label(self.row1_frame, text="—", anchor="w", font=_FONT)
         self.type_label.pack(side="left", padx=(0, 8))
 
-        self.clan_label = tk.Label(self.row1_frame, text="—", anchor="w", font=("TkDefaultFont", 9))
+        self.clan_label = tk.Label(self.row1_frame, text="—", anchor="w", font=_FONT)
         self.clan_label.pack(side="left")
 
         self.row2_frame = tk.Frame(self.frame)
         self.row2_frame.pack(fill="x", pady=2)
 
+        # The stat frames are built on the first card shown rather than at window open; until then
+        # the row stays empty, the same as after clear().
         self.stats = {}
-        stat_abbrevs = [
-            ("F", "force"),
-            ("C", "chi"),
-            ("PH", "personal_honor"),
-            ("HR", "honor_requirement"),
-            ("Foc", "focus"),
-            ("GC", "gold_cost"),
-            ("GP", "gold_production"),
-            ("PS", "province_strength"),
-            ("SH", "starting_honor"),
-        ]
-
-        for abbrev, field in stat_abbrevs:
+
+    def _build_stats(self) -> None:
+        """Create one label pair per stat in ``_STAT_ABBREVS``, all hidden."""
+        # Each stat keeps a fixed grid column, so hiding one (grid_remove) and showing it again
+        # restores it in place without re-running the layout of its neighbours.
+        for column, (abbrev, field) in enumerate(_STAT_ABBREVS):
             stat_frame = tk.Frame(self.row2_frame)
-            stat_frame.pack(side="left", padx=(0, 8))
+            stat_frame.grid(row=0, column=column, padx=(0, 8), sticky="w")
+            stat_frame.grid_remove()
 
-            label = tk.Label(stat_frame, text=f"{abbrev}:", font=("TkDefaultFont", 9, "bold"))
+            label = tk.Label(stat_frame, text=f"{abbrev}:", font=_FONT_BOLD)
             label.pack(side="left")
 
-            value_label = tk.Label(stat_frame, text="—", font=("TkDefaultFont", 9))
+            value_label = tk.Label(stat_frame, text="—", font=_FONT)
             value_label.pack(side="left", padx=(2, 0))
 
             self.stats[field] = (stat_frame, value_label)
@@ -103,28 +143,30 @@ class CardStatsPanel:
         types = card.get("types") or []
         clans = card.get("clans") or []
 
-        self.name_label.configure(text=name)
-        self.type_label.configure(text=", ".join(types) if types else "—")
-        self.clan_label.configure(text=", ".join(clans) if clans else "—")
+        set_text(self.name_label, name)
+        set_text(self.type_label, ", ".join(types) if types else "—")
+        set_text(self.clan_label, ", ".join(clans) if clans else "—")
 
         # Row 2: Numeric data - show/hide based on what's available
+        if not self.stats:
+            self._build_stats()
         for field, (frame, value_label) in self.stats.items():
             value = card.get(field)
             if value is not None:
-                value_label.configure(text=str(value))
-                frame.pack(side="left", padx=(0, 8))
+                set_text(value_label, str(value))
+                frame.grid()
             else:
-                frame.pack_forget()
+                frame.grid_remove()
 
     def clear(self) -> None:
         """Clear all stats."""
-        self.name_label.configure(text="—")
-        self.type_label.configure(text="—")
-        self.clan_label.configure(text="—")
+        set_text(self.name_label, "—")
+        set_text(self.type_label, "—")
+        set_text(self.clan_label, "—")
 
         for field, (frame, value_label) in self.stats.items():
-            value_label.configure(text="—")
-            frame.pack_forget()
+            set_text(value_label, "—")
+            frame.grid_remove()
 
 
 class PrintSelector:
@@ -162,14 +204,14 @@ class PrintSelector:
             Total number of prints available
         """
         if total_prints > 1:
-            self.info_lbl.configure(text=f"{set_name} ({current_index + 1}/{total_prints})")
+            set_text(self.info_lbl, f"{set_name} ({current_index + 1}/{total_prints})")
             self._enable_buttons()
         else:
-            self.info_lbl.configure(text=f"{set_name}")
+            set_text(self.info_lbl, f"{set_name}")
             self._disable_buttons()
 
     def clear(self) -> None:
-        self.info_lbl.configure(text="")
+        set_text(self.info_lbl, "")
         self._disable_buttons()
 
     def _enable_buttons(self) -> None:
@@ -4,13 +4,13 @@ from collections.abc import Callable
 
 from yasuki_core.card_art import CustomPrint, classify
 from yasuki_gui.ui.deck_builder.art_swap import BorrowArtDialog
-from yasuki_gui.ui.deck_builder.components import CardStatsPanel, PrintSelector
+from yasuki_gui.ui.deck_builder.components import CardStatsPanel, PrintSelector, set_text
 from yasuki_gui.ui.deck_builder.card_preview import (
     CardPreviewController,
     back_image_source,
     front_image_source,
 )
-from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository, DeckState
+from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository, DeckState, deck_side
 from yasuki_gui.ui.deck_builder.deck_components import FilteredCardList, DeckCardList
 from yasuki_gui.ui.deck_builder.deck_io import serialize_deck, import_deck_yaml
 from yasuki_gui.ui.deck_builder.filter_dialog import FilterDialog, FilterOptions
@@ -19,6 +19,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_HEADING_FONT = ("TkDefaultFont", 11, "bold")
+_LABEL_FONT = ("TkDefaultFont", 9, "bold")
+_TEXT_FONT = ("TkDefaultFont", 9)
+
+
+def _search_delay(query: str) -> int:
+    """Debounce delay in ms for a search: a one- or two-letter query matches much of the catalog,
+    so wait longer for the next keystroke; a longer one is cheap, so run it sooner."""
+    n = len(query.strip())
+    return 300 if n < 3 else 150 if n < 5 else 50
+
 
 class DeckBuilderWindow:
     """
@@ -48,6 +59,7 @@ class DeckBuilderWindow:
         self._updating_lists = False
         self._filter_options = FilterOptions()
         self._search_debounce_id = None
+        self._preview_debounce_id = None
 
         self._setup_layout()
         self._setup_event_bindings()
@@ -113,21 +125,17 @@ class DeckBuilderWindow:
         tk.Button(name_frame, text="Import", command=self._import_deck).pack(side="left", padx=2)
         tk.Button(name_frame, text="Export", command=self._export_deck).pack(side="left")
 
-        self.fate_label = tk.Label(col, text="Fate Deck (0)", font=("TkDefaultFont", 11, "bold"))
+        self.fate_label = tk.Label(col, text="Fate Deck (0)", font=_HEADING_FONT)
         self.fate_label.pack(anchor="w")
         self.fate_list = DeckCardList(col, self._repository, "FATE")
         self.fate_list.pack(fill="both", expand=True, pady=(4, 0))
 
-        self.dynasty_label = tk.Label(
-            col, text="Dynasty Deck (0)", font=("TkDefaultFont", 11, "bold")
-        )
+        self.dynasty_label = tk.Label(col, text="Dynasty Deck (0)", font=_HEADING_FONT)
         self.dynasty_label.pack(anchor="w", pady=(12, 0))
         self.dynasty_list = DeckCardList(col, self._repository, "DYNASTY")
         self.dynasty_list.pack(fill="both", expand=True, pady=(4, 0))
 
-        tk.Label(col, text="Setup Cards", font=("TkDefaultFont", 11, "bold")).pack(
-            anchor="w", pady=(12, 0)
-        )
+        tk.Label(col, text="Setup Cards", font=_HEADING_FONT).pack(anchor="w", pady=(12, 0))
         self.setup_list = DeckCardList(col, self._repository, "SETUP")
         self.setup_list.frame.configure(height=150)
         self.setup_list.pack(fill="x", pady=(4, 0))
@@ -145,7 +153,7 @@ class DeckBuilderWindow:
         """Create right column with card preview."""
         col = tk.Frame(parent, padx=8, pady=8)
 
-        tk.Label(col, text="Card Preview", font=("TkDefaultFont", 11, "bold")).pack(anchor="w")
+        tk.Label(col, text="Card Preview", font=_HEADING_FONT).pack(anchor="w")
 
         preview_img_lbl = tk.Label(col)
         preview_img_lbl.pack(anchor="n", pady=(4, 0), expand=True, fill="both")
@@ -169,25 +177,21 @@ class DeckBuilderWindow:
         stats_panel = CardStatsPanel(col)
         stats_panel.pack(fill="x", pady=(4, 0))
 
-        tk.Label(col, text="Flavor Text", font=("TkDefaultFont", 9, "bold")).pack(
-            anchor="w", pady=(4, 2)
-        )
+        tk.Label(col, text="Flavor Text", font=_LABEL_FONT).pack(anchor="w", pady=(4, 2))
 
         flavor_holder = tk.Frame(col)
         flavor_holder.pack(fill="x", pady=(0, 4))
-        flavor_text = tk.Text(flavor_holder, wrap="word", height=3, font=("TkDefaultFont", 9))
+        flavor_text = tk.Text(flavor_holder, wrap="word", height=3, font=_TEXT_FONT)
         flavor_text.pack(side="left", fill="x", expand=True)
         flavor_scroll = tk.Scrollbar(flavor_holder, orient="vertical", command=flavor_text.yview)
         flavor_text.configure(yscrollcommand=flavor_scroll.set, state="disabled")
         flavor_scroll.pack(side="left", fill="y")
 
-        tk.Label(col, text="Rules Text", font=("TkDefaultFont", 9, "bold")).pack(
-            anchor="w", pady=(4, 2)
-        )
+        tk.Label(col, text="Rules Text", font=_LABEL_FONT).pack(anchor="w", pady=(4, 2))
 
         text_holder = tk.Frame(col)
         text_holder.pack(fill="x", pady=(0, 8))
-        preview_text = tk.Text(text_holder, wrap="word", height=6, font=("TkDefaultFont", 9))
+        preview_text = tk.Text(text_holder, wrap="word", height=6, font=_TEXT_FONT)
         preview_text.pack(side="left", fill="x", expand=True)
         tscroll = tk.Scrollbar(text_holder, orient="vertical", command=preview_text.yview)
         preview_text.configure(yscrollcommand=tscroll.set, state="disabled")
@@ -214,23 +218,17 @@ class DeckBuilderWindow:
 
     def _setup_event_bindings(self) -> None:
         """Bind event handlers for user interactions."""
-        self.card_list.bind("<Double-Button-1>", lambda e: self._add_selected())
-        self.card_list.bind("<<ListboxSelect>>", lambda e: self._on_card_list_select())
+        self.card_list.bind("<Double-Button-1>", self._add_selected)
+        self.card_list.bind("<<ListboxSelect>>", self._on_card_list_select)
 
-        self.fate_list.bind("<Double-Button-1>", lambda e: self._remove_from_fate())
-        self.fate_list.bind(
-            "<<ListboxSelect>>", lambda e: self._on_deck_list_select(self.fate_list)
-        )
+        self.fate_list.bind("<Double-Button-1>", self._remove_from_fate)
+        self.fate_list.bind("<<ListboxSelect>>", self._on_fate_select)
 
-        self.dynasty_list.bind("<Double-Button-1>", lambda e: self._remove_from_dynasty())
-        self.dynasty_list.bind(
-            "<<ListboxSelect>>", lambda e: self._on_deck_list_select(self.dynasty_list)
-        )
+        self.dynasty_list.bind("<Double-Button-1>", self._remove_from_dynasty)
+        self.dynasty_list.bind("<<ListboxSelect>>", self._on_dynasty_select)
 
-        self.setup_list.bind("<Double-Button-1>", lambda e: self._remove_from_setup())
-        self.setup_list.bind(
-            "<<ListboxSelect>>", lambda e: self._on_deck_list_select(self.setup_list)
-        )
+        self.setup_list.bind("<Double-Button-1>", self._remove_from_setup)
+        self.setup_list.bind("<<ListboxSelect>>", self._on_setup_select)
 
     def _close(self) -> None:
         if callable(self.on_close):
@@ -249,8 +247,8 @@ class DeckBuilderWindow:
         if self._search_debounce_id is not None:
             self.win.after_cancel(self._search_debounce_id)
 
-        # Schedule new search after delay (150ms is responsive but reduces queries)
-        self._search_debounce_id = self.win.after(150, self._execute_search)
+        delay = _search_delay(self.search_var.get())
+        self._search_debounce_id = self.win.after(delay, self._execute_search)
 
     def _execute_search(self) -> None:
         """Execute the actual search (called after debounce delay)."""
@@ -291,9 +289,7 @@ class DeckBuilderWindow:
 
         def order_key(card_id: str) -> tuple[int, str]:
             card = cards.get(card_id) or {}
-            decks = set(card.get("decks") or [])
-            side = "DYNASTY" if "Dynasty" in decks else "FATE" if "Fate" in decks else "SETUP"
-            return (self._SIDE_ORDER[side], card.get("name", ""))
+            return (self._SIDE_ORDER[deck_side(card)], card.get("name", ""))
 
         images = []
         for card_id in sorted(self._deck_state.cards, key=order_key):
@@ -397,7 +393,7 @@ class DeckBuilderWindow:
                 parent=self.win,
             )
 
-    def _add_selected(self) -> None:
+    def _add_selected(self, _event=None) -> None:
         card_id = self.card_list.get_selected_card_id()
         if not card_id:
             return
@@ -418,8 +414,7 @@ class DeckBuilderWindow:
         ):
             return self.preview_controller.get_current_print_id()
 
-        prints = self._repository.get_prints(card_id)
-        return prints[0]["print_id"] if prints else None
+        return self._repository.get_default_print_id(card_id)
 
     def _add_from_preview(self) -> None:
         card_id = self.preview_controller.get_current_card_id()
@@ -450,7 +445,7 @@ class DeckBuilderWindow:
         custom_id = self._repository.register_custom_print(recipe)
         self.preview_controller.load_card(base["card_id"], preferred_print_id=custom_id)
 
-    def _remove_from_fate(self) -> None:
+    def _remove_from_fate(self, _event=None) -> None:
         ids = self.fate_list.get_selected_ids()
         if not ids:
             return
@@ -458,7 +453,7 @@ class DeckBuilderWindow:
         self._deck_state = self._deck_state.remove_card(card_id, print_id)
         self._refresh_deck_lists()
 
-    def _remove_from_dynasty(self) -> None:
+    def _remove_from_dynasty(self, _event=None) -> None:
         ids = self.dynasty_list.get_selected_ids()
         if not ids:
             return
@@ -466,7 +461,7 @@ class DeckBuilderWindow:
         self._deck_state = self._deck_state.remove_card(card_id, print_id)
         self._refresh_deck_lists()
 
-    def _remove_from_setup(self) -> None:
+    def _remove_from_setup(self, _event=None) -> None:
         ids = self.setup_list.get_selected_ids()
         if not ids:
             return
@@ -481,26 +476,26 @@ class DeckBuilderWindow:
             self.dynasty_list.refresh(self._deck_state)
             self.setup_list.refresh(self._deck_state)
 
-            fate_count = self._deck_state.get_card_count("FATE", self._repository.cards_by_id)
-            dynasty_count = self._deck_state.get_card_count("DYNASTY", self._repository.cards_by_id)
-            setup_count = self._deck_state.get_card_count("SETUP", self._repository.cards_by_id)
+            counts = self._deck_state.get_side_counts(self._repository.cards_by_id)
+            fate_count, dynasty_count = counts["FATE"], counts["DYNASTY"]
+            setup_count = counts["SETUP"]
 
-            self.fate_label.config(text=f"Fate Deck ({fate_count})")
-            self.dynasty_label.config(text=f"Dynasty Deck ({dynasty_count})")
+            set_text(self.fate_label, f"Fate Deck ({fate_count})")
+            set_text(self.dynasty_label, f"Dynasty Deck ({dynasty_count})")
 
-            self.win.title(
-                f"Deck Builder - Fate:{fate_count} Dynasty:{dynasty_count} Setup:{setup_count}"
-            )
+            title = f"Deck Builder - Fate:{fate_count} Dynasty:{dynasty_count} Setup:{setup_count}"
+            if self.win.title() != title:
+                self.win.title(title)
         finally:
             self._updating_lists = False
 
-    def _on_card_list_select(self) -> None:
+    def _on_card_list_select(self, _event=None) -> None:
         if self._updating_lists:
             return
 
         card_id = self.card_list.get_selected_card_id()
         if card_id:
-            self.preview_controller.load_card(card_id)
+            self._schedule_preview(card_id)
         # Don't clear if no card selected - might be mid-click
 
     def _on_deck_list_select(self, deck_list: DeckCardList) -> None:
@@ -510,9 +505,29 @@ class DeckBuilderWindow:
         ids = deck_list.get_selected_ids()
         if ids:
             print_id, card_id = ids
-            self.preview_controller.load_card(card_id, print_id)
+            self._schedule_preview(card_id, print_id)
         # Don't clear if no selection - might be clicking on type header or mid-transition
 
+    def _on_fate_select(self, _event=None) -> None:
+        self._on_deck_list_select(self.fate_list)
+
+    def _on_dynasty_select(self, _event=None) -> None:
+        self._on_deck_list_select(self.dynasty_list)
+
+    def _on_setup_select(self, _event=None) -> None:
+        self._on_deck_list_select(self.setup_list)
+
+    def _schedule_preview(self, card_id: str, print_id: int | None = None) -> None:
+        """Preview a selected card once the selection settles, so arrowing through a list loads
+        only the card it stops on rather than every card it passes."""
+        if self._preview_debounce_id is not None:
+            self.win.after_cancel(self._preview_debounce_id)
+        self._preview_debounce_id = self.win.after(60, self._load_preview, card_id, print_id)
+
+    def _load_preview(self, card_id: str, print_id: int | None) -> None:
+        self._preview_debounce_id = None
+        self.preview_controller.load_card(card_id, print_id)
+
     def _on_prev_print(self) -> None:
         self.preview_controller.prev_print()
 
@@ -107,7 +107,10 @@ class FilteredCardList(ScrollableListBox):
         query : str
             Search query string (supports field:value, comparisons, etc.)
         """
-        self._filter_query = query.strip()
+        query = query.strip()
+        if query == self._filter_query:
+            return
+        self._filter_query = query
         self.refresh()
 
     def set_filter_options(self, filter_options: "FilterOptions | None") -> None:
@@ -123,9 +126,6 @@ class FilteredCardList(ScrollableListBox):
         self.refresh()
 
     def refresh(self) -> None:
-        self.clear()
-        self._card_ids = []
-
         # Parse the search query using the query language
         text_query, parsed_filters = parse_and_build_query(self._filter_query)
 
@@ -138,10 +138,8 @@ class FilteredCardList(ScrollableListBox):
         filter_dict = combined_filters if combined_filters else None
 
         filtered = self._repository.filter_cards(text_query, filter_dict)
-        for card in filtered:
-            display_name = format_card_display_name(card)
-            self.insert(tk.END, display_name)
-            self._card_ids.append(card["card_id"])
+        self.set_items([format_card_display_name(card) for card in filtered])
+        self._card_ids = [card["card_id"] for card in filtered]
 
     def get_selected_card_id(self) -> str | None:
         """
@@ -169,6 +167,8 @@ class DeckCardList(ScrollableListBox):
         self._repository = repository
         self._side = side
         self._item_data: list[tuple[int | None, str]] = []
+        # This side's slice of the deck as last drawn, so an edit to another side skips the redraw.
+        self._shown: dict[str, list[tuple[int, int]]] | None = None
 
     def refresh(self, deck_state) -> None:
         """
@@ -179,19 +179,25 @@ class DeckCardList(ScrollableListBox):
         deck_state : DeckState
             Current deck state
         """
-        self.clear()
+        get_card, side = self._repository.get_card, self._side
+        shown = {
+            card_id: print_list
+            for card_id, print_list in deck_state.cards.items()
+            if (card := get_card(card_id)) and card_in_side(card, side)
+        }
+        if shown == self._shown:
+            return
+        self._shown = shown
+        self._repository.prefetch_prints(shown)
+
         self._item_data = []
+        rows: list[str] = []
 
         # Group cards by type
         cards_by_type: dict[str, list[tuple[str, list[tuple[int, int]]]]] = {}
 
-        for card_id, print_list in deck_state.cards.items():
-            card = self._repository.get_card(card_id)
-            if not card:
-                continue
-
-            if not card_in_side(card, self._side):
-                continue
+        for card_id, print_list in shown.items():
+            card = get_card(card_id)
 
             # Group by type
             types = card.get("types") or []
@@ -212,7 +218,7 @@ class DeckCardList(ScrollableListBox):
             # Add type header with count first and proper plural
             plural_type = pluralize(card_type)
             type_header = f"{type_total}x {plural_type}"
-            self.insert(tk.END, type_header)
+            rows.append(type_header)
             self._item_data.append((None, None))  # Type header has no card
 
             # Add cards under this type
@@ -223,12 +229,12 @@ class DeckCardList(ScrollableListBox):
 
                 total_count = sum(count for _, count in print_list)
                 display_name = format_card_display_name(card)
+                prints_by_id = {p["print_id"]: p for p in self._repository.get_prints(card_id)}
 
                 # If only one print, show on one line (indented under type)
                 if len(print_list) == 1:
                     print_id, count = print_list[0]
-                    prints = self._repository.get_prints(card_id)
-                    print_info = next((p for p in prints if p["print_id"] == print_id), None)
+                    print_info = prints_by_id.get(print_id)
                     set_name = print_info.get("set_name") if print_info else None
 
                     if set_name:
@@ -236,24 +242,27 @@ class DeckCardList(ScrollableListBox):
                     else:
                         entry = f"    {total_count}x {display_name}"
 
-                    self.insert(tk.END, entry)
+                    rows.append(entry)
                     self._item_data.append((print_id, card_id))
                 else:
                     # Multiple prints - show hierarchical view (indented under type)
                     entry = f"    {total_count}x {display_name}"
-                    self.insert(tk.END, entry)
+                    rows.append(entry)
                     self._item_data.append((None, card_id))
 
                     # Sub-entries for each print (double indented)
                     for print_id, count in sorted(print_list):
-                        prints = self._repository.get_prints(card_id)
-                        print_info = next((p for p in prints if p["print_id"] == print_id), None)
+                        print_info = prints_by_id.get(print_id)
                         set_name = print_info.get("set_name") if print_info else "Unknown"
 
                         sub_entry = f"        {count}x {set_name}"
-                        self.insert(tk.END, sub_entry)
+                        rows.append(sub_entry)
                         self._item_data.append((print_id, card_id))
 
+        # Adding or removing one copy changes its type header and its own row; rows outside that
+        # span are left alone.
+        self.set_items(rows)
+
     def _add_deck_entry(self, card: dict, card_id: str, print_id: int, count: int) -> None:
         """DEPRECATED: No longer used, kept for compatibility."""
         pass
@@ -304,4 +313,4 @@ class DeckCardList(ScrollableListBox):
         count : int
             Total cards
         """
-        return deck_state.get_card_count(self._side, cards_by_id)
+        return deck_state.get_side_counts(cards_by_id)[self._side]
@@ -1,7 +1,13 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
-from yasuki_core.database import query_all_cards, get_prints_by_card_id, query_cards_filtered
+from yasuki_core.database import (
+    query_all_cards,
+    get_prints_by_card_id,
+    get_prints_by_card_ids,
+    query_cards_filtered,
+)
 from yasuki_core.card_art import CustomPrint, custom_print_id
 from yasuki_gui.ui.deck_builder.custom_art import custom_print_record
 
@@ -10,7 +16,12 @@ if TYPE_CHECKING:
 
 _CARDS_CACHE: list[dict] | None = None
 
+# Searches remembered per repository; backspacing to an earlier query, or toggling a filter back,
+# reuses its sorted result instead of querying the database again.
+_FILTER_CACHE_SIZE = 128
+
 _SIDE_TO_DECK = {"FATE": "Fate", "DYNASTY": "Dynasty"}
+_PLAY_DECKS = frozenset(_SIDE_TO_DECK.values())
 
 
 def card_in_side(card: dict, side: str) -> bool:
@@ -32,10 +43,30 @@ def card_in_side(card: dict, side: str) -> bool:
     """
     decks = card.get("decks") or []
     if side == "SETUP":
-        return not ({"Fate", "Dynasty"} & set(decks))
+        return _PLAY_DECKS.isdisjoint(decks)
     return _SIDE_TO_DECK.get(side, side) in decks
 
 
+def deck_side(card: dict) -> str:
+    """
+    Classify a card into its deck-builder side.
+
+    Parameters
+    ----------
+    card : dict
+        Card record with a ``decks`` list.
+
+    Returns
+    -------
+    side : str
+        ``"DYNASTY"``, ``"FATE"``, or ``"SETUP"`` for a card in neither play deck.
+    """
+    decks = card.get("decks") or ()
+    if "Dynasty" in decks:
+        return "DYNASTY"
+    return "FATE" if "Fate" in decks else "SETUP"
+
+
 def _extract_experience_sort_key(card: dict) -> tuple[int, str]:
     """
     Extract experience level for sorting.
@@ -109,6 +140,17 @@ def _card_sort_key(card: dict) -> tuple[str, int, str]:
     return base_name, exp_priority, exp_string
 
 
+def _freeze(value):
+    """A hashable stand-in for a filter value (lists, tuples, sets and dicts nested in any mix)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
 def clear_cards_cache() -> None:
     """Clear the cards cache to force reload from database."""
     global _CARDS_CACHE
@@ -141,6 +183,11 @@ class DeckState:
     """
 
     cards: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    # The last get_side_counts result with the catalog it was computed against; every edit returns
+    # a new state, so this never goes stale.
+    _side_counts: tuple[dict, dict[str, int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_card(self, card_id: str, print_id: int) -> "DeckState":
         """
@@ -153,26 +200,48 @@ class DeckState:
         print_id : int
             Print identifier
 
+        Returns
+        -------
+        new_state : DeckState
+            Updated deck state
+        """
+        return self.add_cards([(card_id, print_id, 1)])
+
+    def add_cards(self, entries: Iterable[tuple[str, int, int]]) -> "DeckState":
+        """
+        Add several cards to the deck at once.
+
+        The deck is copied once for the whole batch rather than once per copy, which is what makes
+        loading a decklist linear in its size.
+
+        Parameters
+        ----------
+        entries : iterable of (str, int, int)
+            ``(card_id, print_id, count)`` triples, applied in order. Entries with a count below
+            one (a "0x" decklist line) add nothing.
+
         Returns
         -------
         new_state : DeckState
             Updated deck state
         """
         new_cards = dict(self.cards)
+        copied: set[str] = set()
 
-        if card_id not in new_cards:
-            new_cards[card_id] = [(print_id, 1)]
-        else:
-            print_list = list(new_cards[card_id])
-            found = False
-            for i, (pid, count) in enumerate(print_list):
+        for card_id, print_id, count in entries:
+            if count <= 0:
+                continue
+            if card_id in copied:
+                print_list = new_cards[card_id]
+            else:
+                print_list = new_cards[card_id] = list(new_cards.get(card_id, ()))
+                copied.add(card_id)
+            for i, (pid, existing) in enumerate(print_list):
                 if pid == print_id:
-                    print_list[i] = (pid, count + 1)
-                    found = True
+                    print_list[i] = (pid, existing + count)
                     break
-            if not found:
-                print_list.append((print_id, 1))
-            new_cards[card_id] = print_list
+            else:
+                print_list.append((print_id, count))
 
         return replace(self, cards=new_cards)
 
@@ -260,6 +329,41 @@ class DeckState:
                 total += sum(count for _, count in print_list)
         return total
 
+    def get_side_counts(self, cards_by_id: dict[str, dict]) -> dict[str, int]:
+        """
+        Count total cards for every side in one pass over the deck.
+
+        Equivalent to :meth:`get_card_count` for each of FATE, DYNASTY and SETUP. The result is
+        remembered on this (immutable) state for the same ``cards_by_id``.
+
+        Parameters
+        ----------
+        cards_by_id : dict of str to dict
+            Card data lookup by ID
+
+        Returns
+        -------
+        counts : dict of str to int
+            Total card count keyed by side
+        """
+        if self._side_counts is not None and self._side_counts[0] is cards_by_id:
+            return self._side_counts[1]
+        counts = {"FATE": 0, "DYNASTY": 0, "SETUP": 0}
+        for card_id, print_list in self.cards.items():
+            card = cards_by_id.get(card_id)
+            if not card:
+                continue
+            decks = card.get("decks") or ()
+            n = sum(count for _, count in print_list)
+            if "Fate" in decks:
+                counts["FATE"] += n
+            if "Dynasty" in decks:
+                counts["DYNASTY"] += n
+            if _PLAY_DECKS.isdisjoint(decks):
+                counts["SETUP"] += n
+        object.__setattr__(self, "_side_counts", (cards_by_id, counts))
+        return counts
+
 
 class DeckBuilderRepository:
     """Repository for deck builder data operations."""
@@ -267,7 +371,18 @@ class DeckBuilderRepository:
     def __init__(self):
         self._all_cards = load_cards_from_db()
         self._cards_by_id = {c["card_id"]: c for c in self._all_cards}
+        # Each card's lowercased name and experience rank, computed once rather than per search.
+        self._sort_keys = {c["card_id"]: _card_sort_key(c) for c in self._all_cards}
+        # The unfiltered listing, shown whenever the search box and filters are empty.
+        self._all_cards_sorted = tuple(sorted(self._all_cards, key=self._sort_key))
         self._custom_prints: dict[int, CustomPrint] = {}
+        self._filter_results: dict[tuple, tuple[dict, ...]] = {}
+        # Database prints per card id; the card pool is fixed for the session, so one query each.
+        self._db_prints: dict[str, tuple[dict, ...]] = {}
+
+    def _sort_key(self, card: dict) -> tuple[str, int, str]:
+        """Look up a card's precomputed sort key, computing it for a card outside the pool."""
+        return self._sort_keys.get(card["card_id"]) or _card_sort_key(card)
 
     @property
     def all_cards(self) -> list[dict]:
@@ -308,13 +423,45 @@ class DeckBuilderRepository:
             Database print records followed by synthetic custom-print records whose recipient is
             this card.
         """
-        prints = get_prints_by_card_id(card_id)
+        db_prints = self._db_prints.get(card_id)
+        if db_prints is None:
+            db_prints = self._db_prints[card_id] = tuple(get_prints_by_card_id(card_id))
         customs = [
             custom_print_record(recipe, self)
             for recipe in self._custom_prints.values()
             if recipe.recipient_card_id == card_id
         ]
-        return prints + customs
+        return [*db_prints, *customs]
+
+    def prefetch_prints(self, card_ids: Iterable[str]) -> None:
+        """
+        Load the database prints of every card not yet seen in a single query.
+
+        Parameters
+        ----------
+        card_ids : iterable of str
+            Cards whose prints are about to be looked up, e.g. everything in a deck list.
+        """
+        missing = [card_id for card_id in card_ids if card_id not in self._db_prints]
+        for card_id, prints in get_prints_by_card_ids(missing).items():
+            self._db_prints[card_id] = tuple(prints)
+
+    def get_default_print_id(self, card_id: str) -> int | None:
+        """
+        Get the print a card is added with when no particular print is chosen.
+
+        Parameters
+        ----------
+        card_id : str
+            Card identifier
+
+        Returns
+        -------
+        print_id : int or None
+            The first print from ``get_prints``, or None if the card has no prints.
+        """
+        prints = self.get_prints(card_id)
+        return prints[0]["print_id"] if prints else None
 
     def register_custom_print(self, recipe: CustomPrint) -> int:
         """Register an art-swap recipe and return its stable synthetic print id."""
@@ -336,6 +483,7 @@ class DeckBuilderRepository:
 
         Uses SQL-based filtering for optimal performance.
         Sorts results by name, then by experience level within each name group.
+        Results are remembered per query and filters, so repeating a search skips the database.
 
         Parameters
         ----------
@@ -358,13 +506,19 @@ class DeckBuilderRepository:
             elif hasattr(filter_options, "has_filters") and filter_options.has_filters():
                 filter_dict = filter_options.filters
 
-        # Performance optimization: use cached cards when no query and no filters
-        # This avoids expensive database query when showing all cards
         if not query and not filter_dict:
-            # Return cached cards sorted by name and experience
-            return sorted(self._all_cards, key=_card_sort_key)
+            return list(self._all_cards_sorted)
+
+        key = (query, _freeze(filter_dict) if filter_dict else None)
+        cached = self._filter_results.get(key)
+        if cached is not None:
+            return list(cached)
 
         cards = query_cards_filtered(text_query=query, filter_options=filter_dict)
 
         # Sort by name and experience level (SQL sorts by name, we refine with experience)
-        return sorted(cards, key=_card_sort_key)
+        result = sorted(cards, key=self._sort_key)
+        if len(self._filter_results) >= _FILTER_CACHE_SIZE:
+            del self._filter_results[next(iter(self._filter_results))]
+        self._filter_results[key] = tuple(result)
+        return result
@@ -159,7 +159,7 @@ def import_deck_yaml(
     parsed = parse_deck_yaml(text)
     cards_by_ext = _build_name_index(repository)
 
-    state = DeckState()
+    additions: list[tuple[str, int, int]] = []
     unresolved = []
 
     section_sides = {"pre_game": None, "dynasty": "DYNASTY", "fate": "FATE"}
@@ -199,10 +199,9 @@ def import_deck_yaml(
                 else:
                     unresolved.append(entry["art"]["name"])
 
-            for _ in range(entry["count"]):
-                state = state.add_card(card_id, print_id)
+            additions.append((card_id, print_id, entry["count"]))
 
-    return state, parsed["name"], parsed["author"], unresolved
+    return DeckState().add_cards(additions), parsed["name"], parsed["author"], unresolved
 
 
 def _resolve_custom_print(recipient_card_id, recipient_print_id, art, cards_by_ext, repository):
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import filedialog
 from collections.abc import Callable
 
+from yasuki_core.engine.players import PlayerId
+from yasuki_core.engine.table import ZoneKey, ZoneRole
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
 from yasuki_gui import theme
@@ -10,50 +12,96 @@ from yasuki_gui.visuals import DeckVisual
 from yasuki_gui.constants import CARD_W, CARD_H
 
 
+def _scrolling_canvas(win: tk.Toplevel, width: int, height: int) -> tk.Canvas:
+    """A panel-coloured canvas packed into ``win`` above a horizontal scrollbar."""
+    canvas = tk.Canvas(win, width=width, height=height, bg=theme.PANEL, highlightthickness=0)
+    hscroll = tk.Scrollbar(win, orient="horizontal", command=canvas.xview)
+    canvas.configure(xscrollcommand=hscroll.set)
+    canvas.pack(fill="both", expand=True)
+    hscroll.pack(fill="x")
+    return canvas
+
+
+def dialogs_for(toplevel: tk.Misc) -> "Dialogs":
+    """The :class:`Dialogs` shared by everything opening dialogs over ``toplevel``, built on first
+    use. Kept on the toplevel itself, so its pooled inspect windows are reused across clicks and go
+    away with it."""
+    dialogs = getattr(toplevel, "_dialogs", None)
+    if dialogs is None:
+        dialogs = Dialogs(toplevel, ImageProvider(toplevel))
+        toplevel._dialogs = dialogs  # type: ignore[attr-defined]
+    return dialogs
+
+
 class Dialogs:
     def __init__(self, toplevel: tk.Misc, image_provider: ImageProvider):
         self.toplevel = toplevel
         self.images = image_provider
+        # Keyed by seat and pile: both seats' piles share captions, and each keeps its own window.
+        self._inspect_pool: dict[tuple[PlayerId, ZoneRole], tuple[tk.Toplevel, tk.Canvas]] = {}
+
+    def deck_inspect(self, cards: list[L5RCard], zone: ZoneKey, label: str) -> None:
+        win, canvas = self._inspect_window(zone, label)
+        keep: dict[str, object] = win._images  # type: ignore[attr-defined]
+        keep.clear()
+        self.images.prefetch(cards)
+        canvas.delete("all")
+        self._draw_card_row(canvas, cards, pad=10, keep=keep)
+        canvas.configure(scrollregion=canvas.bbox("all"))
 
-    def deck_inspect(self, cards: list[L5RCard], label: str) -> None:
+    def _inspect_window(self, zone: ZoneKey, label: str) -> tuple[tk.Toplevel, tk.Canvas]:
+        """The inspect window for ``zone``'s pile: built on first use, then withdrawn rather than
+        destroyed on close so a later inspect of the same pile only redraws its cards."""
+        key = (zone.owner, zone.role)
+        pooled = self._inspect_pool.get(key)
+        if pooled is not None and pooled[0].winfo_exists():
+            win = pooled[0]
+            win.deiconify()
+            win.lift()
+            return pooled
         win = tk.Toplevel(self.toplevel)
-        win.title(f"Inspect - {label}")
-        canvas = tk.Canvas(win, width=800, height=260, bg=theme.PANEL)
-        hscroll = tk.Scrollbar(win, orient="horizontal", command=canvas.xview)
-        canvas.configure(xscrollcommand=hscroll.set)
-        frame = tk.Frame(canvas, bg=theme.PANEL)
-        canvas.create_window((0, 0), window=frame, anchor="nw")
-        keep: list[object] = []
-        pad = 10
+        win.title(f"Inspect - {zone.owner.name} {label}")
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        canvas = _scrolling_canvas(win, width=800, height=260)
+        # Photos shown, by card id, to prevent GC while the window holds them.
+        win._images = {}  # type: ignore[attr-defined]
+        self._inspect_pool[key] = (win, canvas)
+        return win, canvas
+
+    def _draw_card_row(
+        self, canvas: tk.Canvas, cards: list[L5RCard], pad: int, keep: dict[str, object]
+    ) -> int:
+        """Draw ``cards`` left to right on ``canvas``, each as one image item (or a named
+        placeholder when it has no art) tagged ``card:<index>``. Each card is a canvas item
+        rather than a widget, so a long pile costs no more windows than a short one.
+
+        Returns
+        -------
+        int
+            The y of the row's bottom edge, below which callers can add captions.
+        """
+        x, bottom = pad, pad
         for idx, card in enumerate(cards):
-            bowed = card.bowed
-            face_up = card.face_up
             photo = (
-                self.images.front(card.image_front, bowed, card.inverted)
-                if face_up
-                else self.images.back(card.side, bowed, card.inverted, card.image_back)
+                self.images.front(card.image_front, card.bowed, card.inverted)
+                if card.face_up
+                else self.images.back(card.side, card.bowed, card.inverted, card.image_back)
             )
-            holder = tk.Frame(frame, bg=theme.PANEL)
-            holder.grid(row=0, column=idx, padx=pad, pady=pad)
+            w, h = (CARD_H, CARD_W) if card.bowed else (CARD_W, CARD_H)
+            tags = (f"card:{idx}",)
             if photo is not None:
-                lbl = tk.Label(holder, image=photo, bg=theme.PANEL)
-                lbl.pack()
-                keep.append(photo)
+                canvas.create_image(x, pad, image=photo, anchor="nw", tags=tags)
+                keep[card.id] = photo
             else:
-                w, h = (CARD_H, CARD_W) if card.bowed else (CARD_W, CARD_H)
-                c = tk.Canvas(holder, width=w, height=h, bg=theme.CARD_FACE, highlightthickness=0)
-                c.pack()
-                c.create_text(w // 2, h // 2, text=card.name, fill=theme.INK)
-
-        def _update_scrollregion():
-            frame.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        _update_scrollregion()
-        canvas.pack(fill="both", expand=True)
-        hscroll.pack(fill="x")
-        # prevent GC on PhotoImage objects
-        win._images = keep  # type: ignore[attr-defined]
+                canvas.create_rectangle(
+                    x, pad, x + w, pad + h, fill=theme.CARD_FACE, outline="", tags=tags
+                )
+                canvas.create_text(
+                    x + w // 2, pad + h // 2, text=card.name, fill=theme.INK, width=w - 8, tags=tags
+                )
+            x += w + 2 * pad
+            bottom = max(bottom, pad + h)
+        return bottom
 
     def deck_search(
         self,
@@ -62,49 +110,39 @@ class Dialogs:
         draw_cb: Callable[[int], None],
         n: int | None = None,
     ) -> None:
-        win = tk.Toplevel(self.toplevel)
-        title = f"Search Top {n} - {label}" if n else f"Search - {label}"
-        win.title(title)
-        list_frame = tk.Frame(win, bg=theme.PANEL)
-        list_frame.pack(fill="both", expand=True)
-        keep: list[object] = []
         # Determine slice of deck to show
         shown = cards[-n:] if n else cards[:]
         if not shown:
             return
+        win = tk.Toplevel(self.toplevel)
+        title = f"Search Top {n} - {label}" if n else f"Search - {label}"
+        win.title(title)
+        keep: dict[str, object] = {}
+        self.images.prefetch(shown)
+        pad = 6
+        width = sum((CARD_H if c.bowed else CARD_W) + 2 * pad for c in shown)
+        canvas = _scrolling_canvas(win, width=min(width, 800), height=CARD_H + 2 * pad + 24)
 
         def draw_card_at_index(idx_in_deck: int) -> None:
             try:
                 draw_cb(idx_in_deck)
             finally:
-                try:
+                if win.winfo_exists():
                     win.destroy()
-                except Exception:
-                    pass
 
+        bottom = self._draw_card_row(canvas, shown, pad=pad, keep=keep)
         for col, card in enumerate(shown):
             # Map displayed index to actual deck index
             idx_in_deck = (len(cards) - len(shown)) + col if n else col
-            bowed = card.bowed
-            face_up = card.face_up
-            photo = (
-                self.images.front(card.image_front, bowed, card.inverted)
-                if face_up
-                else self.images.back(card.side, bowed, card.inverted, card.image_back)
+            tag = f"card:{col}"
+            x0, _, x1, _ = canvas.bbox(tag)
+            canvas.create_text(
+                (x0 + x1) // 2, bottom + 10, text="Draw", fill=theme.INK, tags=(tag,)
             )
-            cell = tk.Frame(list_frame, bg=theme.PANEL)
-            cell.grid(row=0, column=col, padx=6, pady=6)
-            if photo is not None:
-                lbl = tk.Label(cell, image=photo, bg=theme.PANEL)
-                lbl.pack()
-                keep.append(photo)
-            else:
-                w, h = (CARD_H, CARD_W) if card.bowed else (CARD_W, CARD_H)
-                c = tk.Canvas(cell, width=w, height=h, bg=theme.CARD_FACE, highlightthickness=0)
-                c.pack()
-                c.create_text(w // 2, h // 2, text=card.name, fill=theme.INK)
-            btn = tk.Button(cell, text="Draw", command=lambda i=idx_in_deck: draw_card_at_index(i))
-            btn.pack(pady=4)
+            canvas.tag_bind(tag, "<Button-1>", lambda _e, i=idx_in_deck: draw_card_at_index(i))
+            canvas.tag_bind(tag, "<Enter>", lambda _e: canvas.configure(cursor="hand2"))
+            canvas.tag_bind(tag, "<Leave>", lambda _e: canvas.configure(cursor=""))
+        canvas.configure(scrollregion=canvas.bbox("all"))
         win._images = keep  # type: ignore[attr-defined]
 
     def card_search(
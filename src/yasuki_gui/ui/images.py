@@ -1,3 +1,5 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 import tkinter as tk
@@ -5,48 +7,92 @@ import tkinter as tk
 from PIL import Image, ImageTk
 
 from yasuki_core.paths import FATE_BACK, DYNASTY_BACK, resolve_set_image_path
+from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
 from yasuki_gui.constants import CARD_W, CARD_H
 from functools import lru_cache
 
 
-@lru_cache(maxsize=1024)
-def load_image(
-    path: Path | str | None,
-    bowed: bool,
-    inverted: bool,
-    master: tk.Misc | None = None,
-    target: tuple[int, int] | None = None,
-) -> Any | None:
-    """
-    Returns a Tk PhotoImage (master-bound) for the given path.
-    Cache key includes the master object identity implicitly via hashing the object.
-    """
-    if Image is None or ImageTk is None or not path:
-        return None
+_RESAMPLE = Image.Resampling.BILINEAR
+# Modes ImageTk hands straight to Tk. Anything else (palette, greyscale, CMYK) is converted once up
+# front, which also keeps palette images off the nearest-neighbour path Pillow forces on resize.
+_TK_MODES = frozenset({"RGB", "RGBA"})
+
+
+@lru_cache(maxsize=512)
+def _load_pil(path: Path | str, bowed: bool, inverted: bool, target: tuple[int, int]) -> Any | None:
+    """Decode, orient, and resize a card image once, independent of any Tk master."""
     # Card records store set-relative paths ("sets/.../card.jpg"); bundled defaults are absolute.
     resolved = path if Path(path).is_absolute() else resolve_set_image_path(str(path))
     if resolved is None:
         return None
-    path_str = str(resolved)
     try:
-        img = Image.open(path_str)
-        target = target or (CARD_W, CARD_H)
+        img = Image.open(str(resolved))
+        # Let JPEG decode at a reduced scale that still leaves twice the target resolution, so the
+        # cheap bilinear filter has enough pixels to downsample from without aliasing.
+        img.draft(None, (target[0] * 2, target[1] * 2))
+        if img.mode not in _TK_MODES:
+            img = img.convert("RGBA")
+        img = img.resize(target, _RESAMPLE)
+        # Rotate after resizing: quarter turns are lossless, and the resized image is far smaller.
         if bowed:
-            target = (target[1], target[0])
             img = img.rotate(-90, expand=True)
         if inverted:
             img = img.rotate(180, expand=True)
-        resample = getattr(Image, "LANCZOS", None)
-        img = img.resize(target) if resample is None else img.resize(target, resample)
-
-        # PhotoImage is associated with the given master; callers should pass a stable master.
-        photo = ImageTk.PhotoImage(img, master=master)
-        return photo
+        return img
     except OSError:
         return None
 
 
+@lru_cache(maxsize=1024)
+def _load_photo(
+    path: Path | str,
+    bowed: bool,
+    inverted: bool,
+    target: tuple[int, int],
+    root: tk.Misc | None,
+) -> Any | None:
+    img = _load_pil(path, bowed, inverted, target)
+    return None if img is None else ImageTk.PhotoImage(img, master=root)
+
+
+def load_image(
+    path: Path | str | None,
+    bowed: bool,
+    inverted: bool,
+    master: tk.Misc | None = None,
+    target: tuple[int, int] | None = None,
+) -> Any | None:
+    """Return a cached Tk PhotoImage of a card image, or None if it cannot be loaded.
+
+    A PhotoImage can be shown by any widget of the interpreter it was created in, so the cache is
+    keyed by ``master``'s root window rather than ``master`` itself: every window shares one image,
+    and short-lived Toplevels are never held alive by the cache.
+
+    Parameters
+    ----------
+    path : Path, str, or None
+        Absolute path, or a set-relative path as stored on card records.
+    bowed : bool
+        Rotate a quarter turn clockwise (the target size swaps accordingly).
+    inverted : bool
+        Rotate half a turn.
+    master : tk.Misc or None
+        Any widget of the Tk application the image is for; None uses the default root.
+    target : tuple of int or None
+        Upright (width, height) to resize to; defaults to the board card size.
+
+    Returns
+    -------
+    photo : ImageTk.PhotoImage or None
+        The image, or None when ``path`` is empty or the file cannot be read.
+    """
+    if Image is None or ImageTk is None or not path:
+        return None
+    root = master._root() if master is not None else None
+    return _load_photo(path, bowed, inverted, target or (CARD_W, CARD_H), root)
+
+
 essential_backs = {Side.FATE: FATE_BACK, Side.DYNASTY: DYNASTY_BACK}
 
 
@@ -65,9 +111,70 @@ def load_back_image(
     return load_image(path, bowed, inverted, master=master, target=target)
 
 
+_decoder: ThreadPoolExecutor | None = None
+
+
+def prefetch_images(
+    requests: Iterable[tuple[Path | str | None, bool, bool]],
+    target: tuple[int, int] | None = None,
+) -> None:
+    """Decode and resize card images on worker threads, returning once all are cached.
+
+    Pillow releases the GIL while decoding and resampling, so a batch of images loads in parallel;
+    a following :func:`load_image` for any of them only wraps the cached result in a PhotoImage.
+
+    Parameters
+    ----------
+    requests : iterable of (path, bowed, inverted)
+        The images to warm, as they will later be passed to :func:`load_image`.
+    target : tuple of int or None
+        Upright (width, height) to resize to; defaults to the board card size.
+    """
+    decoder = _decode_pool()
+    size = target or (CARD_W, CARD_H)
+    jobs = [
+        decoder.submit(_load_pil, path, bowed, inverted, size)
+        for path, bowed, inverted in requests
+        if path
+    ]
+    for job in jobs:
+        job.result()
+
+
+def warm_essential_backs() -> list[Future]:
+    """Start decoding the stock Fate and Dynasty backs, upright and bowed, in the background.
+
+    Every face-down card draws one of these, so warming them at startup keeps the decode out of the
+    first board render. Returns immediately with the pending decodes.
+    """
+    decoder = _decode_pool()
+    return [
+        decoder.submit(_load_pil, path, bowed, False, (CARD_W, CARD_H))
+        for path in essential_backs.values()
+        for bowed in (False, True)
+    ]
+
+
+def submit_decode(fn: Callable[..., Any], /, *args: Any) -> Future:
+    """Run ``fn(*args)`` on the shared image-decode threads and return its pending result.
+
+    For decodes outside the board cache (e.g. the deck builder's preview); the result must still be
+    wrapped in a PhotoImage on the Tk thread.
+    """
+    return _decode_pool().submit(fn, *args)
+
+
+def _decode_pool() -> ThreadPoolExecutor:
+    global _decoder
+    if _decoder is None:
+        _decoder = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-decode")
+    return _decoder
+
+
 def clear_image_cache() -> None:
-    """Clear all cached PhotoImages (use when changing masters/themes or freeing memory)."""
-    load_image.cache_clear()  # type: ignore[attr-defined]
+    """Clear all cached images, decoded and PhotoImage alike (use when freeing memory)."""
+    _load_photo.cache_clear()
+    _load_pil.cache_clear()
 
 
 class ImageProvider:
@@ -91,6 +198,18 @@ class ImageProvider:
     ) -> Any | None:
         return load_back_image(side, bowed, inverted, image_back, master=self.master)
 
+    def prefetch(self, cards: Iterable[L5RCard]) -> None:
+        """Decode the images ``cards`` show (front when face up, else back) in parallel, so the
+        front/back calls that follow only build PhotoImages."""
+        prefetch_images(
+            (
+                card.image_front if card.face_up else card.image_back or essential_backs[card.side],
+                card.bowed,
+                card.inverted,
+            )
+            for card in cards
+        )
+
     def clear(self) -> None:
         # Clears module-level caches (shared across providers).
         clear_image_cache()
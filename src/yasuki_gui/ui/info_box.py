@@ -8,8 +8,7 @@ from yasuki_core.engine.table import DeckKey, ZoneKey, ZoneRole
 from yasuki_core.game_pieces.constants import Side
 from yasuki_gui import theme
 from yasuki_gui.field_view import FieldView
-from yasuki_gui.ui.dialogs import Dialogs
-from yasuki_gui.ui.images import ImageProvider
+from yasuki_gui.ui.dialogs import dialogs_for
 
 try:
     from PIL import Image, ImageTk  # type: ignore
@@ -209,11 +208,11 @@ class PlayerInfoBox(tk.Frame):
         self._hand_cell.grid(row=0, column=2, padx=2, pady=2)
 
     def _inspect(self, role: ZoneRole, label: str) -> None:
-        cards = self.field.zone_render_cards(ZoneKey(self.owner, role))
+        zone = ZoneKey(self.owner, role)
+        cards = self.field.zone_render_cards(zone)
         if not cards:
             return
-        master = self.winfo_toplevel()
-        Dialogs(master, ImageProvider(master)).deck_inspect(cards, label)
+        dialogs_for(self.winfo_toplevel()).deck_inspect(cards, zone, label)
 
     def cell_counts(self) -> dict[str, int]:
         """The count shown in each grid cell, keyed by a stable cell name, read from the field's
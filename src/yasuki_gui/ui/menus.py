@@ -2,8 +2,7 @@ import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
 
-from yasuki_gui.ui.dialogs import Dialogs
-from yasuki_gui.ui.images import ImageProvider
+from yasuki_gui.ui.dialogs import dialogs_for
 from yasuki_gui.ui.deck_builder import open_deck_builder as _open_deck_builder
 
 
@@ -15,7 +14,7 @@ def build_menubar(root: tk.Misc, field_view) -> tk.Menu:
         # Determine which player panel is local from the field_view and update a stored profile on field_view
         name = getattr(field_view, "profile_name", "Player")
         avatar = getattr(field_view, "profile_avatar", None)
-        dialogs = Dialogs(root, ImageProvider(root))
+        dialogs = dialogs_for(root)
 
         def apply_prefs(new_name: str, new_avatar: str | None) -> None:
             setattr(field_view, "profile_name", new_name)
@@ -1,5 +1,8 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar
 
 from yasuki_core.engine.players import PlayerId
 from yasuki_core.engine.redaction import HiddenCard
@@ -37,6 +40,10 @@ class HiddenFace:
     image_front: Path | None = None
     image_back: Path | None = None
     name: str = ""
+    # A hidden face has no print identity and shows no counters; shared class-level values let
+    # the visuals read these directly on any render card instead of probing with getattr.
+    printed_id: ClassVar[str | None] = None
+    counters: ClassVar[Mapping[str, int]] = MappingProxyType({})
 
     @property
     def active_face(self) -> "HiddenFace":
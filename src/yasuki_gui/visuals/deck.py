@@ -2,7 +2,7 @@ import tkinter as tk
 
 from yasuki_gui import theme
 from yasuki_gui.ui.images import ImageProvider
-from yasuki_gui.constants import CARD_W, CARD_H
+from yasuki_gui.constants import CARD_W, CARD_H, DECK_TAG
 from yasuki_gui.visuals.cardface import RenderCard
 from yasuki_gui.visuals.visual import Visual, draw_count_pill
 from yasuki_core.engine.players import PlayerId
@@ -49,7 +49,7 @@ class DeckVisual(Visual):
                 self.top.side, bowed=False, inverted=False, image_back=self.top.image_back
             )
         if photo is not None:
-            canvas.create_image(x, y, image=photo, tags=(self.tag, "deck"))
+            canvas.create_image(x, y, image=photo, tags=(self.tag, DECK_TAG))
         else:
             canvas.create_rectangle(
                 x0,
@@ -59,7 +59,7 @@ class DeckVisual(Visual):
                 fill=theme.CARD_BACK if count else theme.SURFACE,
                 outline=theme.CARD_BACK_BORDER if count else theme.LINE,
                 width=1,
-                tags=(self.tag, "deck"),
+                tags=(self.tag, DECK_TAG),
             )
         label_fill = theme.ON_DARK if count else theme.INK_DIM
         canvas.create_text(
@@ -68,7 +68,7 @@ class DeckVisual(Visual):
             text=self.label,
             fill=label_fill,
             font=theme.serif(8),
-            tags=(self.tag, "deck"),
+            tags=(self.tag, DECK_TAG),
         )
         if count:
-            draw_count_pill(canvas, x1, y1, count, self.tag)
+            draw_count_pill(canvas, x1, y1, count, self.tag, DECK_TAG)
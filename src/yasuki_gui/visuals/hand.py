@@ -2,7 +2,7 @@ import tkinter as tk
 
 from yasuki_core.engine.players import PlayerId
 from yasuki_gui import theme
-from yasuki_gui.constants import CARD_W, CARD_H, HAND_GAP, HAND_PADDING
+from yasuki_gui.constants import CARD_W, CARD_H, HAND_GAP, HAND_PADDING, ZONE_TAG
 from yasuki_gui.ui.images import ImageProvider, load_image as _li, load_back_image as _lbi
 from yasuki_gui.visuals.cardface import RenderCard
 from yasuki_gui.visuals.visual import Visual
@@ -30,6 +30,9 @@ class HandVisual(Visual):
         self.tag = tag
         self.images = images
         self.selected_ids = selected_ids
+        # Canvas items drawn so far: the frame, and per card id its look and slot centre.
+        self._frame: int | None = None
+        self._drawn: dict[str, tuple[tuple, int, int]] = {}
 
     @property
     def size(self) -> tuple[int, int]:
@@ -84,71 +87,122 @@ class HandVisual(Visual):
             return None
         return idx
 
+    def _card_tag(self, card_id: str) -> str:
+        return f"{self.tag}:{card_id}"
+
     def draw(self, canvas: tk.Canvas) -> None:
+        """Bring the hand's canvas items in line with its cards.
+
+        Items persist between draws: a card whose look is unchanged is only moved to its slot, a
+        changed card is redrawn, and cards no longer held are deleted. If the frame has gone
+        missing (its tag was deleted, or this is a new canvas) the whole hand is drawn afresh.
+        """
         x, y = self.x, self.y
         w, h = self.size
-        # A faint frame marks the hand strip and its empty drop area.
-        canvas.create_rectangle(
-            x - w // 2,
-            y - h // 2,
-            x + w // 2,
-            y + h // 2,
-            outline=theme.LINE_SOFT,
-            width=1,
-            tags=(self.tag, "zone", "hand"),
-        )
+        x0, y0, x1, y1 = (x - w // 2, y - h // 2, x + w // 2, y + h // 2)
+        if self._frame is None or not canvas.find_withtag(self._frame):
+            canvas.delete(self.tag)
+            self._drawn = {}
+            # A faint frame marks the hand strip and its empty drop area.
+            self._frame = canvas.create_rectangle(
+                x0,
+                y0,
+                x1,
+                y1,
+                outline=theme.LINE_SOFT,
+                width=1,
+                tags=(self.tag, ZONE_TAG, "hand"),
+            )
+        else:
+            canvas.coords(self._frame, x0, y0, x1, y1)
         viewer = getattr(canvas, "local_player", None)
         owner = self.owner
-        # An opponent's hand card shows its back unless its owner has shown it.
+        previous = self._drawn
+        drawn: dict[str, tuple[tuple, int, int]] = {}
         for i, card in enumerate(self.cards):
             cx, cy = self.center_for_index(i)
+            # An opponent's hand card shows its back unless its owner has shown it.
             show_front = not (
                 owner is not None and viewer is not None and owner != viewer and not card.shown
             )
-            front_art = card.active_face.image_front
-            if self.images is not None:
-                photo = (
-                    self.images.front(front_art, card.bowed, card.inverted)
-                    if show_front
-                    else self.images.back(card.side, card.bowed, card.inverted, card.image_back)
-                )
-            else:
-                photo = (
-                    _li(front_art, card.bowed, card.inverted, master=canvas)
-                    if show_front
-                    else _lbi(card.side, card.bowed, card.inverted, card.image_back, master=canvas)
-                )
-            cw, ch = (CARD_H, CARD_W) if card.bowed else (CARD_W, CARD_H)
-            if photo is not None:
-                canvas.create_image(cx, cy, image=photo, tags=(self.tag, "zone", "hand"))
-            else:
-                canvas.create_rectangle(
-                    cx - cw // 2,
-                    cy - ch // 2,
-                    cx + cw // 2,
-                    cy + ch // 2,
-                    fill=theme.CARD_FACE if show_front else theme.CARD_BACK,
-                    outline="",
-                    tags=(self.tag, "zone", "hand"),
-                )
-                if show_front:
-                    canvas.create_text(
-                        cx,
-                        cy,
-                        text=card.active_face.name,
-                        fill=theme.INK,
-                        font=theme.serif(9, "bold"),
-                        width=cw - 10,
-                        justify="center",
-                        tags=(self.tag, "zone", "hand"),
-                    )
             selected = card.id in self.selected_ids
+            face = card.active_face
+            look = (
+                show_front,
+                face.image_front,
+                face.name,
+                card.side,
+                card.image_back,
+                card.bowed,
+                card.inverted,
+                selected,
+            )
+            prev = previous.pop(card.id, None)
+            if prev is not None and prev[0] == look:
+                if prev[1] != cx or prev[2] != cy:
+                    canvas.move(self._card_tag(card.id), cx - prev[1], cy - prev[2])
+            else:
+                if prev is not None:
+                    canvas.delete(self._card_tag(card.id))
+                self._draw_card(canvas, card, cx, cy, show_front, selected)
+            drawn[card.id] = (look, cx, cy)
+        for card_id in previous:
+            canvas.delete(self._card_tag(card_id))
+        self._drawn = drawn
+
+    def _draw_card(
+        self,
+        canvas: tk.Canvas,
+        card: RenderCard,
+        cx: int,
+        cy: int,
+        show_front: bool,
+        selected: bool,
+    ) -> None:
+        tags = (self.tag, ZONE_TAG, "hand", self._card_tag(card.id))
+        front_art = card.active_face.image_front
+        if self.images is not None:
+            photo = (
+                self.images.front(front_art, card.bowed, card.inverted)
+                if show_front
+                else self.images.back(card.side, card.bowed, card.inverted, card.image_back)
+            )
+        else:
+            photo = (
+                _li(front_art, card.bowed, card.inverted, master=canvas)
+                if show_front
+                else _lbi(card.side, card.bowed, card.inverted, card.image_back, master=canvas)
+            )
+        cw, ch = (CARD_H, CARD_W) if card.bowed else (CARD_W, CARD_H)
+        if photo is not None:
+            canvas.create_image(cx, cy, image=photo, tags=tags)
+        else:
             canvas.create_rectangle(
                 cx - cw // 2,
                 cy - ch // 2,
                 cx + cw // 2,
                 cy + ch // 2,
-                outline=theme.SELECT if selected else theme.CARD_BORDER,
-                width=3 if selected else 1,
-                tags=(self.tag, "zone", "hand"),
+                fill=theme.CARD_FACE if show_front else theme.CARD_BACK,
+                outline="",
+                tags=tags,
             )
+            if show_front:
+                canvas.create_text(
+                    cx,
+                    cy,
+                    text=card.active_face.name,
+                    fill=theme.INK,
+                    font=theme.serif(9, "bold"),
+                    width=cw - 10,
+                    justify="center",
+                    tags=tags,
+                )
+        canvas.create_rectangle(
+            cx - cw // 2,
+            cy - ch // 2,
+            cx + cw // 2,
+            cy + ch // 2,
+            outline=theme.SELECT if selected else theme.CARD_BORDER,
+            width=3 if selected else 1,
+            tags=tags,
+        )
@@ -40,6 +40,8 @@ class CardSpriteVisual(Visual):
     bowed_preview: bool = False
     # Keep a strong reference to the last PhotoImage used when drawing art
     _last_image: object | None = None
+    # What _last_image was loaded for, so a redraw with an unchanged face skips the image lookup.
+    _last_image_key: tuple | None = None
 
     @property
     def _bowed(self) -> bool:
@@ -78,8 +80,10 @@ class CardSpriteVisual(Visual):
         # The presented art is the active face: a double-faced card flipped to its back shows that
         # back's front art, while a single-faced card is its own active face.
         front_art = self.card.active_face.image_front
-        img = None
-        if self.images is not None:
+        key = (face_up, front_art, self.card.side, self.card.image_back, bowed, inverted)
+        if key == self._last_image_key:
+            img = self._last_image
+        elif self.images is not None:
             if face_up:
                 img = self.images.front(front_art, bowed, inverted)
             else:
@@ -94,6 +98,7 @@ class CardSpriteVisual(Visual):
                 )
             )
 
+        self._last_image_key = key
         if img is not None:
             # retain reference to prevent Tk image GC
             self._last_image = img
@@ -175,7 +180,7 @@ class CardSpriteVisual(Visual):
     def _draw_counters(self, canvas: tk.Canvas) -> None:
         # A badge per counter kind in the top-right corner, coloured by kind, with the count inside;
         # badges stack downward in a fixed order so a card's counters read consistently.
-        counters = getattr(self.card, "counters", None)
+        counters = self.card.counters
         if not counters:
             return
         w, h = self.size
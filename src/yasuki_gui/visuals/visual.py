@@ -4,10 +4,11 @@ import tkinter as tk
 from yasuki_gui import theme
 
 
-def draw_count_pill(canvas: tk.Canvas, x1: int, y1: int, count: int, tag: str) -> None:
-    """A small dark count pill in a pile or deck's bottom-right corner."""
+def draw_count_pill(canvas: tk.Canvas, x1: int, y1: int, count: int, tag: str, kind: str) -> None:
+    """A small dark count pill in a pile or deck's bottom-right corner, tagged with the owner's
+    ``tag`` and ``kind`` so clicks on it resolve like clicks on the pile itself."""
     canvas.create_rectangle(
-        x1 - 22, y1 - 16, x1 - 3, y1 - 3, fill=theme.COUNT_BG, outline="", tags=(tag, "zone")
+        x1 - 22, y1 - 16, x1 - 3, y1 - 3, fill=theme.COUNT_BG, outline="", tags=(tag, kind)
     )
     canvas.create_text(
         x1 - 12,
@@ -15,7 +16,7 @@ def draw_count_pill(canvas: tk.Canvas, x1: int, y1: int, count: int, tag: str) -
         text=str(count),
         fill=theme.COUNT_FG,
         font=theme.serif(8),
-        tags=(tag, "zone"),
+        tags=(tag, kind),
     )
 
 
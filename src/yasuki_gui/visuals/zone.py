@@ -1,5 +1,6 @@
 import tkinter as tk
 from yasuki_gui import theme
+from yasuki_gui.constants import ZONE_TAG
 from yasuki_gui.ui.images import ImageProvider, load_image as _li, load_back_image as _lbi
 from yasuki_gui.visuals.cardface import RenderCard
 from yasuki_gui.visuals.visual import Visual, draw_count_pill
@@ -27,6 +28,8 @@ class ZoneVisual(Visual):
         self.h = h
         self.tag = tag
         self.images = images
+        # The fingerprint of the items last drawn, so callers can skip an identical redraw.
+        self.drawn_fingerprint: tuple | None = None
 
     @property
     def size(self) -> tuple[int, int]:
@@ -37,7 +40,30 @@ class ZoneVisual(Visual):
         w, h = self.size
         return (self.x - w // 2, self.y - h // 2, self.x + w // 2, self.y + h // 2)
 
+    def fingerprint(self) -> tuple:
+        """Everything :meth:`draw` reads: geometry, label, pile size, and the top card's face.
+
+        Only the top card is visible, so the cards beneath it need no part in the comparison.
+        """
+        top = self.cards[-1] if self.cards else None
+        face = (
+            None
+            if top is None
+            else (
+                top.id,
+                top.side,
+                top.face_up,
+                top.bowed,
+                top.inverted,
+                top.active_face.image_front,
+                top.active_face.name,
+                top.image_back,
+            )
+        )
+        return (self.x, self.y, self.w, self.h, self.is_province, self.name, len(self.cards), face)
+
     def draw(self, canvas: tk.Canvas) -> None:
+        self.drawn_fingerprint = self.fingerprint()
         x, y = self.x, self.y
         w, h = self.size
         is_province = self.is_province
@@ -61,7 +87,7 @@ class ZoneVisual(Visual):
                     else _lbi(top.side, bowed, inverted, top.image_back, master=canvas)
                 )
             if photo is not None:
-                canvas.create_image(x, y, image=photo, tags=(self.tag, "zone"))
+                canvas.create_image(x, y, image=photo, tags=(self.tag, ZONE_TAG))
             else:
                 canvas.create_rectangle(
                     x0,
@@ -70,7 +96,7 @@ class ZoneVisual(Visual):
                     y1,
                     fill=theme.CARD_FACE if face_up else theme.CARD_BACK,
                     outline="",
-                    tags=(self.tag, "zone"),
+                    tags=(self.tag, ZONE_TAG),
                 )
                 if face_up:
                     canvas.create_text(
@@ -81,13 +107,13 @@ class ZoneVisual(Visual):
                         font=theme.serif(9, "bold"),
                         width=w - 10,
                         justify="center",
-                        tags=(self.tag, "zone"),
+                        tags=(self.tag, ZONE_TAG),
                     )
             canvas.create_rectangle(
-                x0, y0, x1, y1, outline=theme.CARD_BORDER, width=1, tags=(self.tag, "zone")
+                x0, y0, x1, y1, outline=theme.CARD_BORDER, width=1, tags=(self.tag, ZONE_TAG)
             )
             if not is_province and len(self.cards) > 1:
-                draw_count_pill(canvas, x1, y1, len(self.cards), self.tag)
+                draw_count_pill(canvas, x1, y1, len(self.cards), self.tag, ZONE_TAG)
             return
         # Empty: a dashed parchment slot for a province, a solid one for a pile, with a faint label.
         canvas.create_rectangle(
@@ -99,7 +125,7 @@ class ZoneVisual(Visual):
             outline=theme.LINE,
             width=1,
             dash=(4, 2) if is_province else (),
-            tags=(self.tag, "zone"),
+            tags=(self.tag, ZONE_TAG),
         )
         canvas.create_text(
             x,
@@ -109,5 +135,5 @@ class ZoneVisual(Visual):
             font=theme.serif(8),
             width=w - 8,
             justify="center",
-            tags=(self.tag, "zone"),
+            tags=(self.tag, ZONE_TAG),
         )
@@ -0,0 +1,47 @@
+from yasuki_core.engine.ops import move_card, remove_from_location
+from yasuki_core.engine.players import PlayerId
+from yasuki_core.engine.table import BATTLEFIELD, TableState, ZoneKey, ZoneRole
+from yasuki_core.game_pieces.cards import L5RCard
+from yasuki_core.game_pieces.constants import Side
+
+
+def _table_with_card_in_hand() -> tuple[TableState, L5RCard]:
+    table = TableState.empty_two_seat()
+    card = L5RCard(id="f1", name="Fate", side=Side.FATE, owner=PlayerId.P1)
+    table.zones[ZoneKey(PlayerId.P1, ZoneRole.HAND)].add(card)
+    table.cards_by_id[card.id] = card
+    return table, card
+
+
+def test_move_card_records_the_new_location():
+    table, card = _table_with_card_in_hand()
+    discard = ZoneKey(PlayerId.P1, ZoneRole.FATE_DISCARD)
+
+    move_card(table, card, discard)
+    assert table.locations[card.id] is table.zones[discard]
+
+    move_card(table, card, BATTLEFIELD)
+    assert table.locations[card.id] is table.battlefield
+    assert table.zones[discard].cards == []
+
+
+def test_remove_from_location_falls_back_when_the_hint_is_stale():
+    table, card = _table_with_card_in_hand()
+    # A direct list mutation elsewhere leaves the recorded location pointing at the wrong zone.
+    table.locations[card.id] = table.zones[ZoneKey(PlayerId.P1, ZoneRole.FATE_DISCARD)]
+
+    remove_from_location(table, card)
+
+    assert table.zones[ZoneKey(PlayerId.P1, ZoneRole.HAND)].cards == []
+    assert card.id not in table.locations
+
+
+def test_remove_from_location_keeps_the_battlefield_order():
+    table = TableState.empty_two_seat()
+    cards = [L5RCard(id=f"c{i}", name="C", side=Side.DYNASTY) for i in range(4)]
+    for card in cards:
+        move_card(table, card, BATTLEFIELD)
+
+    remove_from_location(table, cards[1])
+
+    assert table.battlefield.cards == [cards[0], cards[2], cards[3]]
@@ -194,6 +194,15 @@ def test_the_table_validates_after_setup():
     state.validate()  # raises on any structural violation
 
 
+def test_setup_records_where_each_dealt_card_sits():
+    state = _setup()
+    # Every card setup placed is hinted to the container that holds it, so its first move needs no
+    # table-wide scan.
+    assert state.locations
+    for card_id, container in state.locations.items():
+        assert any(card.id == card_id for card in container.cards)
+
+
 def _two_seat_table(p1_honor, p2_honor, *, p2_has_back=True):
     state = TableState.empty_two_seat()
     state.seats[PlayerId.P1].honor = p1_honor
@@ -1,7 +1,14 @@
 import pytest
 
 from yasuki_core.engine.players import PlayerId
-from yasuki_core.engine.table import TableState, ZoneKey, ZoneRole, DeckKey, BoardPos
+from yasuki_core.engine.table import (
+    TableState,
+    ZoneKey,
+    ZoneRole,
+    DeckKey,
+    BoardPos,
+    seat_provinces,
+)
 from yasuki_core.engine.zones import ProvinceZone
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
@@ -187,3 +194,16 @@ def test_validate_rejects_an_attachment_cycle():
 
     with pytest.raises(ValueError, match="cycle"):
         table.validate()
+
+
+def test_seat_provinces_yields_only_that_seats_provinces_in_table_order():
+    table = TableState.empty_two_seat()
+    keys = [
+        ZoneKey(PlayerId.P1, ZoneRole.PROVINCE, 1),
+        ZoneKey(PlayerId.P2, ZoneRole.PROVINCE, 0),
+        ZoneKey(PlayerId.P1, ZoneRole.PROVINCE, 0),
+    ]
+    for key in keys:
+        table.zones[key] = ProvinceZone(owner=key.owner)
+
+    assert [key for key, _ in seat_provinces(table, PlayerId.P1)] == [keys[0], keys[2]]
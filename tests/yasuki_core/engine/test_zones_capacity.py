@@ -13,3 +13,13 @@ def test_province_capacity_enforced():
     # second add rejected
     assert prov.add(d2) is False
     assert len(prov) == 1
+
+
+def test_add_many_skips_off_side_cards_and_stops_at_capacity():
+    prov = ProvinceZone()
+    f1 = L5RCard(id="f1", name="F1", side=Side.FATE)
+    d1 = L5RCard(id="d1", name="D1", side=Side.DYNASTY)
+    d2 = L5RCard(id="d2", name="D2", side=Side.DYNASTY)
+
+    assert prov.add_many([f1, d1, d2]) == 1  # the fate card is skipped, d2 finds no room
+    assert [c.id for c in prov.cards] == ["d1"]
@@ -66,6 +66,14 @@ class TestTokenization:
         tokens = tokenize_query("")
         assert tokens == []
 
+    def test_unterminated_quote_runs_to_the_end(self):
+        tokens = tokenize_query('clan:Crane "Doji Hot\ttype')
+        assert tokens == ["clan:Crane", '"Doji Hot\ttype']
+
+    def test_quote_mid_token_joins_its_neighbours(self):
+        tokens = tokenize_query('a"b c"d\te')
+        assert tokens == ['a"b c"d', "e"]
+
 
 class TestTokenParsing:
     def test_field_colon_value(self):
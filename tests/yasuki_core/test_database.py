@@ -9,6 +9,7 @@ from yasuki_core.database import (
     get_card_by_id,
     query_all_prints,
     get_prints_by_card_id,
+    get_prints_by_card_ids,
     query_cards_filtered,
     query_cards_page,
     count_cards_filtered,
@@ -167,6 +168,17 @@ def test_get_prints_by_card_id(kuni_yori_cards):
         assert "set_name" in p
 
 
+def test_get_prints_by_card_ids_matches_single_card_lookups(kuni_yori_cards):
+    card_ids = [c["card_id"] for c in kuni_yori_cards[:2]] + ["no_such_card"]
+
+    prints = get_prints_by_card_ids(card_ids)
+
+    assert list(prints) == card_ids
+    assert prints["no_such_card"] == []
+    for card_id in card_ids[:-1]:
+        assert prints[card_id] == get_prints_by_card_id(card_id)
+
+
 class TestSQLFiltering:
     """Test SQL-based card filtering."""
 
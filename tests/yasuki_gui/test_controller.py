@@ -2,6 +2,7 @@ from yasuki_core.engine.players import PlayerId
 from yasuki_core.engine.table import DeckKey, ZoneKey, ZoneRole
 from yasuki_core.engine.intents import Draw
 from yasuki_core.game_pieces.constants import Side
+from yasuki_gui.config import Hotkeys
 from yasuki_gui.tags import card_tag, zone_tag
 
 from tests.yasuki_gui.conftest import DummyEventNamespace
@@ -100,3 +101,19 @@ class TestProvinceActivation:
         field, _ = loaded
         tag = zone_tag(ZoneKey(PlayerId.P2, ZoneRole.PROVINCE, 0))
         assert field._controller._card_at(tag, DummyEventNamespace(x=0, y=0)) is None
+
+
+class TestHotkeys:
+    def test_reconfiguring_moves_the_binding_to_the_new_key(self, field):
+        field.configure_hotkeys(Hotkeys(bow="x"))
+        assert field.bind_all("<KeyPress-x>")
+        assert not field.bind_all("<KeyPress-b>")  # the old bow key no longer fires
+
+    def test_fill_all_key_over_a_province_refills_every_open_one(self, loaded):
+        field, state = loaded
+        mine = [k for k in state.zones if k.owner is PlayerId.P1 and k.role is ZoneRole.PROVINCE]
+        for key in mine[:2]:
+            state.zones[key].cards.clear()
+        field._controller._hover_zone_tag = zone_tag(mine[0])
+        field._controller.on_key(DummyEventNamespace(keysym=Hotkeys().fill_all))
+        assert all(state.zones[key].cards for key in mine)
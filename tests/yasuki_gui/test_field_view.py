@@ -7,7 +7,7 @@ from yasuki_core.engine.table import (
     ZoneKey,
     ZoneRole,
 )
-from yasuki_core.engine.intents import Bow, DestroyProvince, Draw, FlipDeckTop, MoveCard
+from yasuki_core.engine.intents import Bow, DestroyProvince, Draw, FlipDeckTop, Invert, MoveCard
 from yasuki_core.engine.session import EngineSession
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
@@ -282,3 +282,34 @@ class TestDebugSeatFlip:
         field.reconcile_all()
         assert field._flipped is True
         assert card_tag("P2-SH") in field.sprites
+
+
+class TestQueuedRedraws:
+    def test_redraw_requests_coalesce_into_one_idle_flush(self, loaded, root):
+        field, _ = loaded
+        tag = next(iter(field.zones))
+        field.redraw_zone(tag)
+        flush_id = field._flush_id
+        field.redraw_zone(tag)
+        field.request_reconcile()
+        assert field._flush_id == flush_id
+
+        root.update_idletasks()
+        assert field._flush_id is None
+        assert field.find_withtag(tag)
+
+    def test_batched_intents_reconcile_once_on_exit(self, loaded, monkeypatch):
+        field, state = loaded
+        passes = []
+        reconcile_zones = field._reconcile_zones
+        monkeypatch.setattr(
+            field, "_reconcile_zones", lambda: passes.append(1) or reconcile_zones()
+        )
+        card = next(card for card in state.battlefield.cards if card.owner is PlayerId.P1)
+        with field.batch_updates():
+            with field.batch_updates():  # batches nest; only the outermost exit reconciles
+                field.dispatch(Bow((card.id,)))
+            field.dispatch(Invert((card.id,)))
+            assert passes == []
+        assert passes == [1]
+        assert card.bowed and card.inverted
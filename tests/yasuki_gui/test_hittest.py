@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from yasuki_gui.services.hittest import bboxes_intersect, resolve_drop_target, resolve_tag_at
+
+
+class FakeCanvas:
+    def __init__(self, tags: tuple[str, ...]):
+        self._tags = tags
+
+    def find_withtag(self, spec):
+        return (1,) if self._tags else ()
+
+    def gettags(self, item):
+        return self._tags
+
+
+def test_resolve_tag_at_returns_primary_tag_of_card_and_zone_items():
+    assert resolve_tag_at(FakeCanvas(("card:7", "card", "card:7:art", "current")), None) == "card:7"
+    assert (
+        resolve_tag_at(FakeCanvas(("zone:p1:prov:0", "zone", "current")), None) == "zone:p1:prov:0"
+    )
+
+
+def test_resolve_tag_at_ignores_non_interactive_items():
+    assert resolve_tag_at(FakeCanvas(("table", "current")), None) is None
+    assert resolve_tag_at(FakeCanvas(("deck:P1:FATE", "deck", "current")), None) is None
+    assert resolve_tag_at(FakeCanvas(()), None) is None
+
+
+def test_bboxes_intersect_counts_touching_edges_as_overlap():
+    assert bboxes_intersect((0, 0, 10, 10), (5, 5, 20, 20))
+    assert bboxes_intersect((0, 0, 10, 10), (10, 10, 20, 20))
+    assert not bboxes_intersect((0, 0, 10, 10), (11, 0, 20, 10))
+    assert not bboxes_intersect((0, 0, 10, 10), (0, 11, 10, 20))
+
+
+def test_resolve_drop_target_checks_hands_and_zones():
+    view = SimpleNamespace(
+        hands={"hand:p1": SimpleNamespace(bbox=(0, 300, 400, 400))},
+        zones={"zone:p1:prov:0": SimpleNamespace(bbox=(0, 0, 50, 80))},
+    )
+    assert resolve_drop_target(view, 200, 350) == "hand:p1"
+    assert resolve_drop_target(view, 10, 10) == "zone:p1:prov:0"
+    assert resolve_drop_target(view, 200, 100) is None
@@ -37,6 +37,12 @@ class TestProvincePositions:
         assert len(gaps) == 1 and gaps.pop() > CARD_W  # evenly spaced, with a gap between cards
         assert abs(sum(xs) / len(xs) - W / 2) <= 1  # centred about the canvas (within rounding)
 
+    def test_rows_longer_than_the_offset_table_still_centred(self):
+        xs = [x for x, _ in province_positions(W, H, 20, seat_at_bottom=True)]
+        gaps = [b - a for a, b in zip(xs, xs[1:])]
+        assert max(gaps) - min(gaps) <= 1  # even up to rounding
+        assert abs(sum(xs) / len(xs) - W / 2) <= 1
+
     def test_top_seat_mirrors_column_order(self):
         bottom = province_positions(W, H, 4, seat_at_bottom=True)
         top = province_positions(W, H, 4, seat_at_bottom=False)
@@ -1,11 +1,13 @@
+import tkinter as tk
+
 from yasuki_core.engine.players import PlayerId
-from yasuki_core.engine.table import BoardPos
+from yasuki_core.engine.table import BoardPos, ZoneRole
 from yasuki_core.engine.intents import FlipFace
 from yasuki_core.game_pieces.cards import L5RCard
 from yasuki_core.game_pieces.constants import Side
 from yasuki_gui.services import actions
 from yasuki_gui.services.actions import REGISTRY as ACTIONS, ActionContext
-from yasuki_gui.tags import card_tag
+from yasuki_gui.tags import card_tag, zone_tag
 
 
 def _tokens(state):
@@ -102,3 +104,35 @@ class TestFlipFace:
         field.dispatch(FlipFace((front.id,)))
         assert front.showing_back is True
         assert front.active_face is front.back
+
+
+class TestContextMenu:
+    def test_each_build_re_evaluates_the_predicates(self, loaded, root):
+        field, state = loaded
+        probe = actions.Action("probe", "Probe", when=lambda view, ctx: not ctx.card.bowed)
+        ctx = ActionContext(card_tag=card_tag("P1-SH"))
+
+        first = tk.Menu(root, tearoff=0)
+        actions.build_menu(first, field, ctx, (probe,))
+        state.cards_by_id["P1-SH"].bow()  # a rules-engine change, with no intent behind it
+        second = tk.Menu(root, tearoff=0)
+        actions.build_menu(second, field, ctx, (probe,))
+
+        assert first.entrycget(0, "state") == "normal"
+        assert second.entrycget(0, "state") == "disabled"
+
+
+class TestProvinceFill:
+    def test_fill_all_refills_every_open_province_of_the_seat(self, loaded):
+        field, state = loaded
+        mine = [k for k in state.zones if k.owner is PlayerId.P1 and k.role is ZoneRole.PROVINCE]
+        for key in mine[:2]:
+            state.zones[key].cards.clear()
+        ctx = ActionContext(zone_tag=zone_tag(mine[0]))
+        fill_all = ACTIONS["zone.fill_all"]
+        assert fill_all.when(field, ctx)
+
+        fill_all.run(field, ctx)
+
+        assert all(state.zones[key].cards for key in mine)
+        assert not fill_all.when(field, ctx)  # nothing left to fill
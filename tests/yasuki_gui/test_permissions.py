@@ -28,3 +28,8 @@ class TestActionAffordance:
         state.zones[key].cards.clear()
         ctx = ActionContext(zone_tag=zone_tag(key))
         assert ACTIONS["zone.fill"].when(field, ctx) is True
+
+
+def test_menu_label_shows_the_hotkey_only_when_there_is_one():
+    assert ACTIONS["card.toggle_bow"].menu_label == "Bow / Unbow (b)"
+    assert ACTIONS["card.send_hand"].menu_label == "Send to Hand"
@@ -1,10 +1,15 @@
+import time
 import tkinter as tk
 from unittest.mock import Mock
 
 import pytest
+from PIL import Image
 
 from yasuki_gui.ui.deck_builder.card_preview import (
     DEFAULT_BY_TYPE,
+    PREVIEW_CARD_H,
+    PREVIEW_CARD_W,
+    _preview_pil,
     back_image_source,
     format_card_display_name,
     front_image_source,
@@ -59,6 +64,23 @@ def test_format_card_display_name_experienced_level():
     assert "Experienced 2" in result
 
 
+def test_format_card_display_name_experienced_campaign():
+    assert format_card_display_name({"name": "Toku", "card_id": "toku_experienced_cow"}).endswith(
+        "- Experienced (COW)"
+    )
+    assert format_card_display_name({"name": "Toku", "card_id": "toku_experienced_2_cow"}).endswith(
+        "- Experienced 2 (COW)"
+    )
+
+
+def test_preview_resize_is_reused_for_a_revisited_path(tmp_path):
+    path = tmp_path / "card.png"
+    Image.new("RGB", (40, 60)).save(path)
+    first = _preview_pil(str(path))
+    assert first.size == (PREVIEW_CARD_W, PREVIEW_CARD_H)
+    assert _preview_pil(str(path)) is first  # decoded and resized once
+
+
 @pytest.fixture
 def root():
     root = tk.Tk()
@@ -153,6 +175,60 @@ def test_preview_controller_navigation(root, preview_components):
     assert controller.get_current_print_id() == 1
 
 
+def _settle(root, controller, timeout=5.0):
+    """Pump the event loop until the preview's background decode has landed, failing the test if
+    it has not within ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    while controller.image_label.image is None:
+        if time.monotonic() > deadline:
+            pytest.fail("the preview's background decode never landed")
+        root.update()
+
+
+def test_switching_to_a_print_with_the_same_image_keeps_the_photo(
+    root, preview_components, monkeypatch
+):
+    import yasuki_gui.ui.deck_builder.card_preview as cp
+
+    decodes = []
+    real_decode = cp._preview_pil
+    monkeypatch.setattr(cp, "_preview_pil", lambda path: decodes.append(path) or real_decode(path))
+    mock_repo = Mock()
+    mock_repo.get_prints.return_value = [
+        {"print_id": 1, "set_name": "Set 1", "image_path": None},
+        {"print_id": 2, "set_name": "Set 2", "image_path": None},
+    ]
+    mock_repo.get_card.return_value = {"card_id": "card1", "types": ["Strategy"], "decks": ["Fate"]}
+    controller = CardPreviewController(*preview_components, root, mock_repo)
+
+    controller.load_card("card1")
+    _settle(root, controller)
+    controller.next_print()  # both prints fall back to the same type default
+
+    assert len(decodes) == 1
+    assert controller.get_current_print_id() == 2
+
+
+def test_a_stale_background_decode_is_dropped(root, preview_components):
+    mock_repo = Mock()
+    mock_repo.get_prints.return_value = [
+        {"print_id": 1, "set_name": "Set 1", "image_path": None},
+        {"print_id": 2, "set_name": "Set 2", "image_path": None},
+    ]
+    mock_repo.get_card.side_effect = lambda card_id: {
+        "card_id": card_id,
+        "types": ["Strategy" if card_id == "strategy" else "Holding"],
+        "decks": ["Fate"],
+    }
+    controller = CardPreviewController(*preview_components, root, mock_repo)
+
+    controller.load_card("strategy")
+    controller.load_card("holding")  # moved on before the strategy default finished decoding
+    _settle(root, controller)
+
+    assert controller._shown_image_path == DEFAULT_BY_TYPE["holding"]
+
+
 def test_preview_controller_handles_none_text(root, preview_components):
     """Test that None values in text fields don't cause TclError."""
     mock_repo = Mock()
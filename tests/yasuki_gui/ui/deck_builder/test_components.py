@@ -27,6 +27,26 @@ class TestScrollableListBox:
         listbox.clear()
         assert listbox.listbox.size() == 0
 
+    def test_insert_many_appends_in_order(self, root):
+        listbox = ScrollableListBox(root)
+        listbox.insert(0, "Item 1")
+        listbox.insert_many(["Item 2", "Item 3"])
+        listbox.insert_many([])
+        assert listbox.listbox.get(0, "end") == ("Item 1", "Item 2", "Item 3")
+
+    def test_set_items_rewrites_only_the_rows_that_changed(self, root):
+        listbox = ScrollableListBox(root)
+        listbox.set_items(["Akodo", "Bayushi", "Doji", "Hida"])
+        listbox.listbox.selection_set(0)
+
+        listbox.set_items(["Akodo", "Doji", "Hida"])  # one row dropped from the middle
+        assert listbox.listbox.get(0, "end") == ("Akodo", "Doji", "Hida")
+        assert listbox.get_selection() == (0,)  # the untouched leading row kept its selection
+
+        for items in (["Doji", "Kakita", "Togashi"], [], ["Shiba"]):
+            listbox.set_items(items)
+            assert list(listbox.listbox.get(0, "end")) == items
+
     def test_get_selection(self, root):
         listbox = ScrollableListBox(root)
         listbox.insert(0, "Item 1")
@@ -36,6 +56,26 @@ class TestScrollableListBox:
 
 
 class TestCardStatsPanel:
+    def test_stat_frames_are_built_on_the_first_card(self, root):
+        panel = CardStatsPanel(root)
+        assert panel.stats == {}
+        panel.clear()  # clearing an unused panel is a no-op
+
+        panel.update_stats({"name": "Akodo Toturi", "force": 5})
+
+        assert panel.stats["force"][0].winfo_manager() == "grid"
+        assert panel.stats["chi"][0].winfo_manager() == ""
+
+    def test_unchanged_text_is_not_reconfigured(self, root):
+        panel = CardStatsPanel(root)
+        card = {"name": "Akodo Toturi", "types": ["Personality"], "force": 5}
+        panel.update_stats(card)
+        panel.name_label.configure = Mock(wraps=panel.name_label.configure)
+
+        panel.update_stats(card)  # clicking back onto the same card
+
+        panel.name_label.configure.assert_not_called()
+
     def test_update_stats_personality(self, root):
         panel = CardStatsPanel(root)
         card = {
@@ -60,6 +100,16 @@ class TestCardStatsPanel:
         assert panel.stats["personal_honor"][1].cget("text") == "2"
         assert panel.stats["gold_cost"][1].cget("text") == "15"
 
+    def test_stats_hide_and_reappear_in_their_own_column(self, root):
+        panel = CardStatsPanel(root)
+        panel.update_stats({"name": "Gold Mine", "gold_production": 2})
+        assert panel.stats["force"][0].winfo_manager() == ""  # hidden for a card without force
+        panel.update_stats({"name": "Akodo Toturi", "force": 5, "gold_cost": 15})
+
+        force_frame, gold_frame = panel.stats["force"][0], panel.stats["gold_cost"][0]
+        assert force_frame.winfo_manager() == gold_frame.winfo_manager() == "grid"
+        assert force_frame.grid_info()["column"] < gold_frame.grid_info()["column"]
+
     def test_update_stats_holding(self, root):
         panel = CardStatsPanel(root)
         card = {
@@ -3,7 +3,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from yasuki_gui.ui.deck_builder.deck_builder import DeckBuilderWindow
+from yasuki_gui.ui.deck_builder.deck_builder import DeckBuilderWindow, _search_delay
+
+
+def test_search_delay_shortens_as_the_query_narrows():
+    assert _search_delay("") == _search_delay("ab") == 300  # matches most of the catalog
+    assert _search_delay("abc") == _search_delay("abcd") == 150
+    assert _search_delay("abcde") == 50
+    assert _search_delay("  ab  ") == 300  # surrounding spaces don't narrow the search
 
 
 @pytest.fixture
@@ -37,6 +44,20 @@ class TestDeckBuilderWindow:
 
         window.win.destroy()
 
+    def test_arrowing_through_the_list_previews_only_the_last_card(self, root, mock_repository):
+        window = DeckBuilderWindow(root)
+        window.preview_controller.load_card = Mock()
+        for card_id in ("card1", "card2", "card3"):
+            window.card_list.get_selected_card_id = Mock(return_value=card_id)
+            window._on_card_list_select()
+
+        window.win.after(100, root.quit)
+        root.mainloop()
+
+        window.preview_controller.load_card.assert_called_once_with("card3", None)
+
+        window.win.destroy()
+
     def test_close_window(self, root, mock_repository):
         on_close_callback = Mock()
         window = DeckBuilderWindow(root, on_close=on_close_callback)
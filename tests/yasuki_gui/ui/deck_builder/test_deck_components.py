@@ -62,6 +62,14 @@ def test_filtered_card_list_set_filter(root, mock_repository):
     mock_repository.filter_cards.assert_called_with("test query", None)
 
 
+def test_filtered_card_list_skips_an_unchanged_query(root, mock_repository):
+    card_list = FilteredCardList(root, mock_repository)
+    card_list.set_filter("test query")
+    card_list.set_filter("test query ")  # the debounce fired again with the same search
+
+    mock_repository.filter_cards.assert_called_once()
+
+
 def test_filtered_card_list_set_filter_options(root, mock_repository):
     from yasuki_gui.ui.deck_builder.filter_dialog import FilterOptions
 
@@ -144,6 +152,36 @@ def test_deck_card_list_filters_by_side(root, mock_repository):
     assert deck_list.listbox.size() == 2
 
 
+def test_deck_card_list_skips_a_redraw_when_its_side_is_unchanged(root, mock_repository):
+    deck_list = DeckCardList(root, mock_repository, "FATE")
+    state = DeckState(cards={"card1": [(1, 2)]})
+    deck_list.refresh(state)
+    deck_list.listbox.selection_set(1)
+
+    deck_list.refresh(state.add_card("card2", 1))  # a Dynasty card; the Fate rows are unchanged
+
+    assert deck_list.get_selected_ids() == (1, "card1")  # not rebuilt, so the selection stays
+    deck_list.refresh(state.add_card("card1", 1))
+    assert "3x" in deck_list.listbox.get(1)
+
+
+def test_deck_card_list_rewrites_only_the_rows_an_edit_touches(root, mock_repository):
+    cards = {
+        "sword": {"card_id": "sword", "name": "Sword", "decks": ["Fate"], "types": ["Item"]},
+        "ambush": {"card_id": "ambush", "name": "Ambush", "decks": ["Fate"], "types": ["Strategy"]},
+    }
+    mock_repository.get_card = Mock(side_effect=cards.get)
+    deck_list = DeckCardList(root, mock_repository, "FATE")
+    state = DeckState(cards={"sword": [(1, 1)], "ambush": [(1, 1)]})
+    deck_list.refresh(state)
+    deck_list.listbox.selection_set(1)
+
+    deck_list.refresh(state.add_card("ambush", 1))
+
+    assert deck_list.listbox.get(2).startswith("2x")  # the Strategy header and row are rewritten
+    assert deck_list.get_selected_ids() == (1, "sword")  # the Item rows above kept their selection
+
+
 def test_deck_card_list_get_selected_ids(root, mock_repository):
     deck_list = DeckCardList(root, mock_repository, "FATE")
     deck_state = DeckState(cards={"card1": [(42, 2)]})
@@ -253,6 +291,7 @@ def test_deck_card_list_multiple_prints_hierarchical(root, mock_repository):
     sub3 = deck_list.listbox.get(4)
     assert "1x" in sub3
     assert "Twenty Festivals" in sub3
+    mock_repository.get_prints.assert_called_once_with("card1")  # once per card, not per print
 
 
 def test_deck_card_list_single_print_one_line(root, mock_repository):
@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 from yasuki_core.card_art import CustomPrint, custom_print_id
-from yasuki_gui.ui.deck_builder.deck_data import DeckState
+from yasuki_gui.ui.deck_builder.deck_data import DeckState, deck_side
 
 
 def test_deck_state_add_card():
@@ -28,6 +28,20 @@ def test_deck_state_add_same_card_different_print():
     assert state.cards == {"card1": [(1, 1), (2, 1)]}
 
 
+def test_deck_state_add_cards_in_one_batch():
+    state = DeckState(cards={"card1": [(1, 1)]})
+    new_state = state.add_cards([("card1", 2, 3), ("card2", 5, 1), ("card1", 1, 2)])
+
+    assert state.cards == {"card1": [(1, 1)]}  # the original state's print list is untouched
+    assert new_state.cards == {"card1": [(1, 3), (2, 3)], "card2": [(5, 1)]}
+
+
+def test_deck_state_add_cards_skips_zero_counts():
+    state = DeckState().add_cards([("ambush", 1, 0), ("sword", 2, -1)])
+
+    assert state.cards == {}
+
+
 def test_deck_state_remove_card_any_print():
     state = DeckState(cards={"card1": [(1, 2)]})
     new_state = state.remove_card("card1")
@@ -85,6 +99,30 @@ def test_deck_state_get_card_count():
     assert state.get_card_count("SETUP", cards_by_id) == 1
 
 
+def test_deck_state_side_counts_match_the_per_side_counts_in_one_pass():
+    cards_by_id = {
+        "fate": {"decks": ["Fate"]},
+        "dynasty": {"decks": ["Dynasty"]},
+        "stronghold": {"decks": ["Pre-Game"]},
+    }
+    state = DeckState().add_card("fate", 1).add_card("fate", 1).add_card("dynasty", 2)
+    state = state.add_card("stronghold", 3)
+
+    counts = state.get_side_counts(cards_by_id)
+
+    assert counts == {side: state.get_card_count(side, cards_by_id) for side in counts}
+    assert counts == {"FATE": 2, "DYNASTY": 1, "SETUP": 1}
+    assert state.get_side_counts(cards_by_id) is counts  # remembered on the immutable state
+    assert state.remove_card("fate").get_side_counts(cards_by_id)["FATE"] == 1
+
+
+def test_deck_side_classifies_play_decks_and_setup():
+    assert deck_side({"decks": ["Fate"]}) == "FATE"
+    assert deck_side({"decks": ["Dynasty"]}) == "DYNASTY"
+    assert deck_side({"decks": ["Pre-Game"]}) == "SETUP"
+    assert deck_side({}) == "SETUP"
+
+
 def test_repository_registers_and_surfaces_custom_print():
     cards = [
         {"card_id": "collision", "name": "A Collision of Wills", "types": ["Strategy"]},
@@ -116,3 +154,109 @@ def test_repository_registers_and_surfaces_custom_print():
 
         # The custom surfaces only under its recipient, never under the donor card.
         assert repo.get_prints("ikumu") == []
+
+
+def test_repository_queries_each_cards_prints_once():
+    cards = [{"card_id": "a", "name": "Alpha"}]
+    with (
+        patch("yasuki_gui.ui.deck_builder.deck_data.load_cards_from_db", return_value=cards),
+        patch(
+            "yasuki_gui.ui.deck_builder.deck_data.get_prints_by_card_id",
+            return_value=[
+                {"print_id": 7, "set_name": "Ivory"},
+                {"print_id": 9, "set_name": "Jade"},
+            ],
+        ) as query,
+    ):
+        from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository
+
+        repo = DeckBuilderRepository()
+        assert repo.get_default_print_id("a") == 7
+        prints = repo.get_prints("a")
+        prints.clear()
+
+        assert [p["print_id"] for p in repo.get_prints("a")] == [7, 9]  # callers get their own list
+        assert query.call_count == 1
+
+
+def test_repository_prefetches_prints_in_one_query():
+    cards = [{"card_id": "a", "name": "Alpha"}, {"card_id": "b", "name": "Beta"}]
+    with (
+        patch("yasuki_gui.ui.deck_builder.deck_data.load_cards_from_db", return_value=cards),
+        patch(
+            "yasuki_gui.ui.deck_builder.deck_data.get_prints_by_card_ids",
+            return_value={"b": [{"print_id": 3, "set_name": "Jade"}]},
+        ) as batch,
+        patch(
+            "yasuki_gui.ui.deck_builder.deck_data.get_prints_by_card_id",
+            return_value=[{"print_id": 1, "set_name": "Ivory"}],
+        ) as single,
+    ):
+        from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository
+
+        repo = DeckBuilderRepository()
+        repo.get_prints("a")
+        repo.prefetch_prints(["a", "b"])
+
+        batch.assert_called_once_with(["b"])  # "a" was already loaded
+        assert repo.get_default_print_id("b") == 3
+        assert single.call_count == 1
+
+
+def test_repository_reuses_the_result_of_a_repeated_search():
+    cards = [{"card_id": "a", "name": "Alpha"}, {"card_id": "b", "name": "Beta"}]
+    with (
+        patch("yasuki_gui.ui.deck_builder.deck_data.load_cards_from_db", return_value=cards),
+        patch(
+            "yasuki_gui.ui.deck_builder.deck_data.query_cards_filtered", return_value=cards[1:]
+        ) as query,
+    ):
+        from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository
+
+        repo = DeckBuilderRepository()
+        legal = {"legality": ("Ivory Edition", ["legal"])}
+        first = repo.filter_cards("be", legal)
+        repo.filter_cards("b", legal)
+        again = repo.filter_cards("be", {"legality": ("Ivory Edition", ["legal"])})
+
+        assert again == first == cards[1:]
+        assert query.call_count == 2  # "be" was answered from the cache the second time
+        again.clear()
+        assert repo.filter_cards("be", legal) == cards[1:]  # callers get their own list
+
+
+def test_repository_sorts_search_results_by_precomputed_keys():
+    cards = [
+        {"card_id": "toku_experienced_2", "name": "Toku", "types": ["Personality"]},
+        {"card_id": "toku", "name": "Toku", "types": ["Personality"]},
+        {"card_id": "ambush", "name": "Ambush", "types": ["Strategy"]},
+    ]
+    with (
+        patch("yasuki_gui.ui.deck_builder.deck_data.load_cards_from_db", return_value=cards),
+        patch("yasuki_gui.ui.deck_builder.deck_data.query_cards_filtered", return_value=cards),
+    ):
+        from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository
+
+        repo = DeckBuilderRepository()
+        with patch("yasuki_gui.ui.deck_builder.deck_data._card_sort_key") as sort_key:
+            found = repo.filter_cards("o")
+
+        sort_key.assert_not_called()  # every key was computed when the repository loaded
+        assert [c["card_id"] for c in found] == ["ambush", "toku", "toku_experienced_2"]
+
+
+def test_repository_lists_every_card_presorted_without_a_query():
+    cards = [{"card_id": "toku", "name": "Toku"}, {"card_id": "ambush", "name": "Ambush"}]
+    with (
+        patch("yasuki_gui.ui.deck_builder.deck_data.load_cards_from_db", return_value=cards),
+        patch("yasuki_gui.ui.deck_builder.deck_data.query_cards_filtered") as query,
+    ):
+        from yasuki_gui.ui.deck_builder.deck_data import DeckBuilderRepository
+
+        repo = DeckBuilderRepository()
+        listed = repo.filter_cards("")
+        listed.clear()
+
+        assert [c["card_id"] for c in repo.filter_cards("")] == ["ambush", "toku"]
+        query.assert_not_called()
+        assert repo._filter_results == {}  # the full listing never takes a search-cache slot
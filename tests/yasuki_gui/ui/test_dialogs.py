@@ -3,7 +3,9 @@ from unittest.mock import Mock
 
 import pytest
 
-from yasuki_gui.ui.dialogs import Dialogs
+from yasuki_core.engine.players import PlayerId
+from yasuki_core.engine.table import ZoneKey, ZoneRole
+from yasuki_gui.ui.dialogs import Dialogs, dialogs_for
 from yasuki_gui.ui.images import ImageProvider
 
 
@@ -19,6 +21,9 @@ def image_provider(root):
     return ImageProvider(root)
 
 
+_P1_DISCARD = ZoneKey(PlayerId.P1, ZoneRole.FATE_DISCARD)
+
+
 @pytest.fixture
 def dialogs(root, image_provider):
     return Dialogs(root, image_provider)
@@ -32,11 +37,30 @@ class TestDialogs:
         assert dialogs.images is image_provider
 
     def test_deck_inspect(self, dialogs, root):
-        dialogs.deck_inspect([], "Test Deck")
-
-    def test_deck_search_empty(self, dialogs):
+        dialogs.deck_inspect([], _P1_DISCARD, "Test Deck")
+
+    def test_deck_inspect_keeps_a_window_per_seat(self, dialogs):
+        dialogs.deck_inspect([], _P1_DISCARD, "Fate Discard")
+        dialogs.deck_inspect([], ZoneKey(PlayerId.P2, ZoneRole.FATE_DISCARD), "Fate Discard")
+
+        mine = dialogs._inspect_pool[PlayerId.P1, ZoneRole.FATE_DISCARD][0]
+        theirs = dialogs._inspect_pool[PlayerId.P2, ZoneRole.FATE_DISCARD][0]
+        assert mine is not theirs
+        assert mine.title() == "Inspect - P1 Fate Discard"
+        assert theirs.title() == "Inspect - P2 Fate Discard"
+
+    def test_dialogs_for_reuses_one_instance_per_toplevel(self, root):
+        dialogs = dialogs_for(root)
+        dialogs.deck_inspect([], _P1_DISCARD, "Fate Discard")
+        again = dialogs_for(root)
+        assert again is dialogs
+        pooled = dialogs._inspect_pool[PlayerId.P1, ZoneRole.FATE_DISCARD]
+        assert again._inspect_window(_P1_DISCARD, "Fate Discard") is pooled
+
+    def test_deck_search_empty(self, dialogs, root):
         draw_cb = Mock()
         dialogs.deck_search([], "Test Deck", draw_cb)
+        assert not [w for w in root.winfo_children() if isinstance(w, tk.Toplevel)]
 
     def test_deck_search_with_cards(self, dialogs):
         card1 = Mock()
@@ -59,3 +83,13 @@ class TestDialogs:
         on_apply = Mock()
 
         dialogs.preferences("TestPlayer", None, on_apply)
+
+    def test_deck_inspect_reuses_its_window(self, dialogs):
+        dialogs.deck_inspect([], _P1_DISCARD, "Test Deck")
+        win = dialogs._inspect_pool[PlayerId.P1, ZoneRole.FATE_DISCARD][0]
+        win.tk.call(
+            win.protocol("WM_DELETE_WINDOW")
+        )  # closing withdraws the window instead of destroying it
+        assert win.winfo_exists()
+        dialogs.deck_inspect([], _P1_DISCARD, "Test Deck")
+        assert dialogs._inspect_pool[PlayerId.P1, ZoneRole.FATE_DISCARD][0] is win
@@ -3,13 +3,19 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from PIL import Image
 
 from yasuki_core.game_pieces.constants import Side
+from yasuki_gui.constants import CARD_W, CARD_H
 from yasuki_gui.ui.images import (
     load_image,
     load_back_image,
     clear_image_cache,
     ImageProvider,
+    prefetch_images,
+    warm_essential_backs,
+    _load_photo,
+    _load_pil,
 )
 
 
@@ -28,7 +34,7 @@ class TestLoadImage:
     @patch("yasuki_gui.ui.images.Image")
     @patch("yasuki_gui.ui.images.ImageTk")
     def test_load_image_basic(self, mock_imagetk, mock_image, root):
-        mock_img = Mock()
+        mock_img = Mock(mode="RGB")
         mock_image.open.return_value = mock_img
         mock_img.resize.return_value = mock_img
         mock_imagetk.PhotoImage.return_value = Mock()
@@ -42,7 +48,7 @@ class TestLoadImage:
     @patch("yasuki_gui.ui.images.Image")
     @patch("yasuki_gui.ui.images.ImageTk")
     def test_load_image_bowed(self, mock_imagetk, mock_image, root):
-        mock_img = Mock()
+        mock_img = Mock(mode="RGB")
         mock_image.open.return_value = mock_img
         mock_img.rotate.return_value = mock_img
         mock_img.resize.return_value = mock_img
@@ -56,7 +62,7 @@ class TestLoadImage:
     @patch("yasuki_gui.ui.images.Image")
     @patch("yasuki_gui.ui.images.ImageTk")
     def test_load_image_inverted(self, mock_imagetk, mock_image, root):
-        mock_img = Mock()
+        mock_img = Mock(mode="RGB")
         mock_image.open.return_value = mock_img
         mock_img.rotate.return_value = mock_img
         mock_img.resize.return_value = mock_img
@@ -70,16 +76,34 @@ class TestLoadImage:
     def test_load_image_caching(self, root):
         clear_image_cache()
 
-        cache_info_before = load_image.cache_info()
+        cache_info_before = _load_photo.cache_info()
         initial_hits = cache_info_before.hits
 
         test_path = Path("/nonexistent/path.jpg")
         load_image(test_path, False, False, root)
         load_image(test_path, False, False, root)
 
-        cache_info_after = load_image.cache_info()
+        cache_info_after = _load_photo.cache_info()
         assert cache_info_after.hits > initial_hits
 
+    @patch("yasuki_gui.ui.images.Image")
+    @patch("yasuki_gui.ui.images.ImageTk")
+    def test_load_image_shares_photo_across_windows(self, mock_imagetk, mock_image, root):
+        clear_image_cache()
+        mock_img = Mock(mode="RGB")
+        mock_image.open.return_value = mock_img
+        mock_img.resize.return_value = mock_img
+        mock_imagetk.PhotoImage.side_effect = lambda *a, **k: Mock()
+
+        test_path = Path("/test/shared.jpg")
+        top = tk.Toplevel(root)
+        first = load_image(test_path, False, False, root)
+        second = load_image(test_path, False, False, top)
+
+        assert first is second
+        mock_image.open.assert_called_once_with(str(test_path))
+        assert mock_imagetk.PhotoImage.call_args.kwargs["master"] is root
+
 
 class TestLoadBackImage:
     @patch("yasuki_gui.ui.images.load_image")
@@ -111,8 +135,34 @@ class TestLoadBackImage:
 
 def test_clear_image_cache():
     clear_image_cache()
-    cache_info = load_image.cache_info()
-    assert cache_info.currsize == 0
+    assert _load_photo.cache_info().currsize == 0
+    assert _load_pil.cache_info().currsize == 0
+
+
+def test_prefetch_images_warms_the_decode_cache():
+    clear_image_cache()
+    prefetch_images([(Path("/nonexistent/a.jpg"), False, False), (None, False, False)])
+    assert _load_pil.cache_info().currsize == 1
+    before = _load_pil.cache_info().hits
+    _load_pil(Path("/nonexistent/a.jpg"), False, False, (CARD_W, CARD_H))
+    assert _load_pil.cache_info().hits == before + 1
+
+
+def test_warm_essential_backs_decodes_both_sides_upright_and_bowed():
+    clear_image_cache()
+    for job in warm_essential_backs():
+        job.result()
+    assert _load_pil.cache_info().currsize == 4
+
+
+def test_load_pil_converts_palette_images_before_resizing(tmp_path):
+    path = tmp_path / "palette.png"
+    Image.new("P", (CARD_W * 3, CARD_H * 3)).save(path)
+
+    img = _load_pil(path, True, False, (CARD_W, CARD_H))
+
+    assert img.mode == "RGBA"
+    assert img.size == (CARD_H, CARD_W)
 
 
 class TestImageProvider:
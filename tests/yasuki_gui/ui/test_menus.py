@@ -56,10 +56,10 @@ class TestBuildMenubar:
 
         assert "Deck" in menu_labels
 
-    @patch("yasuki_gui.ui.menus.Dialogs")
-    def test_preferences_command(self, mock_dialogs_class, root, mock_field_view):
+    @patch("yasuki_gui.ui.menus.dialogs_for")
+    def test_preferences_command(self, mock_dialogs_for, root, mock_field_view):
         mock_dialogs = Mock()
-        mock_dialogs_class.return_value = mock_dialogs
+        mock_dialogs_for.return_value = mock_dialogs
         assert mock_field_view.profile_name == "TestPlayer"
 
     @patch("yasuki_gui.ui.menus.filedialog")
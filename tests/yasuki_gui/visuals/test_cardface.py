@@ -23,3 +23,6 @@ def test_hidden_card_becomes_a_back_only_face():
     assert face.active_face is face
     assert face.active_face.image_front is None
     assert face.active_face.name == ""
+    # Nor does it carry a print identity or counters, read directly like a real card's.
+    assert face.printed_id is None
+    assert not face.counters
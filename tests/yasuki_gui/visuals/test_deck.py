@@ -33,3 +33,14 @@ def test_draw_with_top_card_uses_back_image_or_fallback(root):
     dv.draw(cv)
     items = cv.find_withtag("deck:2")
     assert items  # at least one item drawn
+
+
+def test_count_pill_carries_the_deck_kind(root):
+    c = L5RCard(id="d1", name="C1", side=Side.FATE)
+    dv = DeckVisual(3, c, x=60, y=60, tag="deck:3", label="Fate Deck")
+    cv = tk.Canvas(root, width=200, height=200)
+
+    dv.draw(cv)
+
+    assert not cv.find_withtag("zone")  # so the hit test never mistakes it for a zone
+    assert all("deck" in cv.gettags(item) for item in cv.find_withtag("deck:3"))
@@ -0,0 +1,49 @@
+import tkinter as tk
+
+from yasuki_gui.visuals.hand import HandVisual
+from yasuki_core.game_pieces.cards import L5RCard
+from yasuki_core.game_pieces.constants import Side
+
+
+def _hand_and_canvas(root, cards):
+    cv = tk.Canvas(root, width=600, height=200)
+    hv = HandVisual(cards, None, x=300, y=100, w=560, h=140, tag="zone:hand")
+    return hv, cv
+
+
+def test_redraw_reuses_items_of_unchanged_cards(root):
+    a = L5RCard(id="a", name="A", side=Side.FATE)
+    b = L5RCard(id="b", name="B", side=Side.FATE)
+    hv, cv = _hand_and_canvas(root, [a])
+    hv.draw(cv)
+    a_items = cv.find_withtag("zone:hand:a")
+    assert a_items
+
+    hv.cards = [a, b]
+    hv.draw(cv)
+    assert cv.find_withtag("zone:hand:a") == a_items
+    assert cv.find_withtag("zone:hand:b")
+
+
+def test_redraw_replaces_changed_and_drops_removed_cards(root):
+    a = L5RCard(id="a", name="A", side=Side.FATE)
+    b = L5RCard(id="b", name="B", side=Side.FATE)
+    hv, cv = _hand_and_canvas(root, [a, b])
+    hv.draw(cv)
+    a_items = cv.find_withtag("zone:hand:a")
+
+    a.bow()
+    hv.cards = [a]
+    hv.draw(cv)
+    assert cv.find_withtag("zone:hand:a") != a_items
+    assert not cv.find_withtag("zone:hand:b")
+
+
+def test_draw_after_tag_delete_rebuilds_whole_hand(root):
+    a = L5RCard(id="a", name="A", side=Side.FATE)
+    hv, cv = _hand_and_canvas(root, [a])
+    hv.draw(cv)
+    cv.delete("zone:hand")
+    hv.draw(cv)
+    assert cv.find_withtag("zone:hand:a")
+    assert len(cv.find_withtag("zone:hand")) > len(cv.find_withtag("zone:hand:a"))
@@ -78,3 +78,30 @@ def test_badges_scale_with_the_cards_counters_not_the_catalogue(root):
     CardSpriteVisual(card, x=100, y=100, tag="card:d").draw(cv)
     discs = [i for i in cv.find_withtag("card:d:counter") if cv.type(i) == "oval"]
     assert len(discs) == 3
+
+
+class _CountingImages:
+    def __init__(self, root):
+        self.photo = tk.PhotoImage(master=root, width=4, height=4)
+        self.calls = 0
+
+    def front(self, *args):
+        self.calls += 1
+        return self.photo
+
+    back = front
+
+
+def test_redraw_with_unchanged_face_reuses_the_loaded_image(root):
+    images = _CountingImages(root)
+    c = L5RCard(id="s9", name="Reuse", side=Side.FATE)
+    sv = CardSpriteVisual(c, x=50, y=50, tag="card:9", images=images)
+    cv = tk.Canvas(root, width=200, height=200)
+
+    sv.draw(cv)
+    sv.draw(cv)
+    assert images.calls == 1
+
+    c.bow()
+    sv.draw(cv)
+    assert images.calls == 2
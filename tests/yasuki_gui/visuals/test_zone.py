@@ -43,3 +43,20 @@ def test_zone_draw_with_top_card_front_and_back(root):
     )
     zv2.draw(cv)
     assert cv.find_withtag("zone:3")
+
+
+def test_zone_fingerprint_tracks_only_what_is_drawn():
+    under = L5RCard(id="f1", name="Under", side=Side.FATE)
+    top = L5RCard(id="f2", name="Top", side=Side.FATE)
+    zv = ZoneVisual(
+        [under, top], is_province=False, name="Fate Discard", x=0, y=0, w=40, h=60, tag="z"
+    )
+    before = zv.fingerprint()
+
+    under.turn_face_down()
+    assert zv.fingerprint() == before  # the buried card is not visible
+
+    top.turn_face_down()
+    assert zv.fingerprint() != before
+    zv.cards.pop(0)
+    assert zv.fingerprint() != before  # the count pill changes with the pile size